@@ -0,0 +1,201 @@
+import heapq
+import random
+import re
+import sys
+import time
+from bisect import bisect_left
+
+from text_analyzer import normalize_text, tokenize
+
+# Sorts after every character a normalized term can contain
+PREFIX_END = "\uffff"
+
+# Prefixes covering more terms than this get their completions cached, so
+# one- and two-letter queries do not merge thousands of postings lists
+HEAVY_PREFIX_TERMS = 64
+CACHED_COMPLETIONS = 10
+
+def normalize_term(text):
+    """Normalize text and drop everything but letters and digits"""
+    return re.sub(r'[\W_]+', '', normalize_text(text))
+
+def course_terms(course):
+    """Return the normalized terms a course can be completed from.
+
+    The code is indexed with its hyphen removed, so "DIGF-2" and "digf2"
+    both complete to DIGF-2003. Title words are indexed individually and,
+    for hyphenated words, joined ("cross-disciplinary" -> "crossdisciplinary").
+    """
+    terms = {normalize_term(course["code"])} if course["code"] else set()
+    for word in course["title"].split():
+        terms.add(normalize_term(word))
+        terms.update(tokenize(word))
+    terms.discard("")
+    return terms
+
+def create_autocomplete_index(catalogue):
+    """Create a sorted-term prefix index over course codes and title words.
+
+    "courses" lists one course id per code, most widely offered first, and
+    "postings" holds, for each entry of the sorted "terms" array, ascending
+    positions into "courses". Smaller positions rank higher, so the first N
+    distinct positions across a prefix's postings are its top-N completions.
+    """
+    courses = catalogue["courses"]
+
+    pathways_by_code = {}
+    course_id_by_code = {}
+    for pathway_name, year, semester, course_type, course_id in catalogue["placements"]:
+        code = courses[course_id]["code"]
+        if not code:
+            continue
+        pathways_by_code.setdefault(code, set()).add(pathway_name)
+        course_id_by_code.setdefault(code, course_id)
+
+    ranked_codes = sorted(course_id_by_code, key=lambda code: (-len(pathways_by_code[code]), code))
+
+    postings_by_term = {}
+    for position, code in enumerate(ranked_codes):
+        for term in course_terms(courses[course_id_by_code[code]]):
+            postings_by_term.setdefault(term, []).append(position)
+
+    terms = sorted(postings_by_term)
+    postings = [postings_by_term[term] for term in terms]
+
+    return {
+        "courses": [course_id_by_code[code] for code in ranked_codes],
+        "terms": terms,
+        "postings": postings,
+        "top": cache_heavy_prefixes(terms, postings)
+    }
+
+def merge_top(postings_lists, limit):
+    """Return the first limit distinct positions across ascending postings lists"""
+    results = []
+    for position in heapq.merge(*postings_lists):
+        if not results or results[-1] != position:
+            results.append(position)
+            if len(results) == limit:
+                break
+    return results
+
+def cache_heavy_prefixes(terms, postings):
+    """Precompute completions for every prefix shared by more than HEAVY_PREFIX_TERMS terms.
+
+    Terms sharing a prefix are contiguous in the sorted array, so each level
+    only splits the ranges that were heavy at the level above.
+    """
+    top = {}
+    ranges = [(0, len(terms), 1)]
+
+    while ranges:
+        start, end, length = ranges.pop()
+        group_start = start
+        while group_start < end:
+            if len(terms[group_start]) < length:
+                # A term shorter than the prefix length only prefixes the terms after it
+                group_start += 1
+                continue
+            prefix = terms[group_start][:length]
+            group_end = bisect_left(terms, prefix + PREFIX_END, group_start, end)
+            if group_end - group_start > HEAVY_PREFIX_TERMS:
+                top[prefix] = merge_top(postings[group_start:group_end], CACHED_COMPLETIONS)
+                ranges.append((group_start, group_end, length + 1))
+            group_start = group_end
+
+    return top
+
+def prefix_positions(autocomplete_index, prefix):
+    """Return the postings lists of every term starting with prefix"""
+    terms = autocomplete_index["terms"]
+    start = bisect_left(terms, prefix)
+    end = bisect_left(terms, prefix + PREFIX_END, start)
+    return autocomplete_index["postings"][start:end]
+
+def complete(autocomplete_index, query, limit=10):
+    """Return up to limit course ids whose code or title words start with every query word"""
+    prefixes = [normalize_term(word) for word in query.split()]
+    prefixes = [prefix for prefix in prefixes if prefix]
+    if not prefixes:
+        return []
+
+    courses = autocomplete_index["courses"]
+
+    if len(prefixes) == 1:
+        cached = autocomplete_index["top"].get(prefixes[0])
+        if cached is not None and limit <= CACHED_COMPLETIONS:
+            return [courses[position] for position in cached[:limit]]
+
+        # Postings are ascending, so merging yields positions best first
+        results = merge_top(prefix_positions(autocomplete_index, prefixes[0]), limit)
+        return [courses[position] for position in results]
+
+    matches = None
+    for prefix in prefixes:
+        positions = set()
+        for postings in prefix_positions(autocomplete_index, prefix):
+            positions.update(postings)
+        matches = positions if matches is None else matches & positions
+        if not matches:
+            return []
+
+    return [courses[position] for position in sorted(matches)[:limit]]
+
+def benchmark(course_count=50000, query_count=20000, seed=0):
+    """Time completions on a synthetic catalogue; returns (build seconds, mean and p99 query microseconds)"""
+    rng = random.Random(seed)
+    subjects = ["DIGF", "INTM", "VISM", "GDES", "ILLU", "HUMN", "EXAN", "INDS"]
+    words = ["introduction", "interactive", "interface", "game", "design", "digital", "media",
+             "studio", "atelier", "critical", "play", "body", "object", "space", "networked",
+             "physical", "computing", "narrative", "animation", "collaboration", "fabrication"]
+
+    courses = []
+    placements = []
+    for course_id in range(course_count):
+        courses.append({
+            "code": f"{rng.choice(subjects)}-{course_id % 10000:04d}",
+            "title": " ".join(rng.choice(words) + str(rng.randint(0, 99)) for _ in range(rng.randint(2, 5))),
+        })
+        for pathway in rng.sample(range(30), rng.randint(1, 4)):
+            placements.append((f"pathway-{pathway}", "1", "fall", "core_courses", course_id))
+
+    start = time.perf_counter()
+    autocomplete_index = create_autocomplete_index({"courses": courses, "placements": placements})
+    build_seconds = time.perf_counter() - start
+
+    queries = [rng.choice(words + subjects)[:rng.randint(1, 6)] for _ in range(query_count)]
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        complete(autocomplete_index, query)
+        timings.append(time.perf_counter() - start)
+
+    timings.sort()
+    return (
+        build_seconds,
+        sum(timings) / len(timings) * 1e6,
+        timings[int(len(timings) * 0.99)] * 1e6
+    )
+
+def main():
+    """Complete a query against a catalogue directory, or benchmark with --benchmark"""
+    if len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+        build_seconds, mean_us, p99_us = benchmark()
+        print(f"Built index in {build_seconds:.2f}s; query mean {mean_us:.1f}us, p99 {p99_us:.1f}us")
+        return
+
+    query = sys.argv[1] if len(sys.argv) > 1 else ""
+    catalogue_dir = sys.argv[2] if len(sys.argv) > 2 else "pathways"
+
+    # course_catalogue imports this module to build the bundle, so the CLI imports it here
+    import course_catalogue
+
+    catalogue = course_catalogue.load_catalogue(catalogue_dir)
+    autocomplete_index = create_autocomplete_index(catalogue)
+
+    for course_id in complete(autocomplete_index, query):
+        course = catalogue["courses"][course_id]
+        print(f"{course['code']}  {course['title']}")
+
+if __name__ == "__main__":
+    main()
@@ -1,37 +1,104 @@
+import codecs
 import json
 import re
 
+import course_catalogue
+from course_scanner import scan_course_text
+
 def parse_course_info(course_text):
     """Parse course information from the CSV text format"""
-    if not course_text or course_text.strip() == "":
-        return None
-
-    # Extract course code and title from the beginning
-    course_match = re.match(r'^([A-Z]{4}-\d{4})\s+(.+?)\s*\(([\d.]+)\s*Credits?\)', course_text.strip())
-    if course_match:
-        course_code = course_match.group(1)
-        course_title = course_match.group(2).strip()
-        credits = float(course_match.group(3))
+    return scan_course_text(course_text, hyphen_optional=False, credits_word_optional=False)
+
+# Spreadsheet columns holding each course type
+COURSE_TYPE_COLUMNS = {
+    3: "core",
+    4: "program_specific",
+    5: "open",
+    6: "breadth"
+}
+
+# Next delimiter outside of quotes
+UNQUOTED_DELIMITER = re.compile(r'[,\r\n]')
+
+def fallback_to_latin1(error):
+    """Decode bytes that Windows-1252 leaves undefined as their Latin-1 characters"""
+    return error.object[error.start:error.end].decode('latin-1'), error.end
+
+codecs.register_error('latin1-fallback', fallback_to_latin1)
+
+def decode_csv_bytes(data):
+    """Decode spreadsheet exports, which are UTF-8 or Windows-1252 depending on the exporter"""
+    try:
+        return data.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return data.decode('cp1252', errors='latin1-fallback')
+
+def tokenize_csv(content):
+    """Split CSV text into rows of cells in a single pass.
+
+    Quoted cells may contain commas, doubled quotes and line breaks. Each cell
+    is assembled from slices of the input and joined once, so the work is
+    linear in the size of the content.
+    """
+    position = 0
+    length = len(content)
+    row = []
+
+    while position < length:
+        quoted = content[position] == '"'
+        if quoted:
+            # Quoted cell: runs to the next quote that is not doubled
+            pieces = []
+            position += 1
+            while True:
+                quote = content.find('"', position)
+                if quote == -1:
+                    # Unterminated quote, take the rest of the input
+                    pieces.append(content[position:])
+                    position = length
+                    break
+                pieces.append(content[position:quote])
+                if content.startswith('"', quote + 1):
+                    pieces.append('"')
+                    position = quote + 2
+                else:
+                    position = quote + 1
+                    break
+            cell = ''.join(pieces)
+
+            # Anything between the closing quote and the delimiter belongs to the cell
+            delimiter = UNQUOTED_DELIMITER.search(content, position)
+            end = delimiter.start() if delimiter else length
+            cell += content[position:end]
+            position = end
+        else:
+            delimiter = UNQUOTED_DELIMITER.search(content, position)
+            end = delimiter.start() if delimiter else length
+            cell = content[position:end]
+            position = end
 
-        # Remove the course code, title, and credits from the text to get description
-        description_text = re.sub(r'^[A-Z]{4}-\d{4}\s+.+\s*\([\d.]+\s*Credits?\)\s*', '', course_text.strip())
+        row.append(cell)
 
-        # Extract prerequisites if they exist
-        prereq_match = re.search(r'Requisites?:\s*(.+?)(?:\n|$)', description_text, re.DOTALL)
-        prerequisites = prereq_match.group(1).strip() if prereq_match else None
+        if position >= length:
+            break
 
-        # Clean up description by removing prerequisites section
-        description = re.sub(r'Requisites?:\s*.+$', '', description_text, flags=re.MULTILINE).strip()
+        if content[position] == ',':
+            position += 1
+            if position == length:
+                row.append('')
+            continue
 
-        return {
-            "code": course_code,
-            "title": course_title,
-            "credits": credits,
-            "description": description,
-            "prerequisites": prerequisites
-        }
+        # Line break, treating \r\n as one
+        if content.startswith('\r\n', position):
+            position += 2
+        else:
+            position += 1
+        # A blank line is an empty row, as csv.reader reads it
+        yield [] if row == [''] and not quoted else row
+        row = []
 
-    return None
+    if row:
+        yield row
 
 def parse_csv_content(content, pathway_name):
     """Parse CSV content and convert to structured JSON"""
@@ -49,38 +116,31 @@ def parse_csv_content(content, pathway_name):
         "years": {}
     }
 
-    lines = content.split('\n')
     current_year = None
     current_semester = None
 
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-
-        # Skip empty lines
-        if not line:
-            i += 1
+    for row in tokenize_csv(content):
+        # Skip empty rows
+        if not any(cell.strip() for cell in row):
             continue
 
-        # Look for year headers
-        if 'YEAR' in line and ('Year 1' in line or 'Year 2' in line or 'Year 3' in line or 'Year 4' in line):
-            year_match = re.search(r'Year (\d+)', line)
-            if year_match:
-                current_year = f"Year {year_match.group(1)}"
+        # Look for year headers, which may share a row with a semester and courses
+        year_match = re.match(r'YEAR (\d+)', row[1]) if len(row) > 1 else None
+        if year_match:
+            current_year = f"Year {year_match.group(1)}"
+            if current_year not in courses_data["years"]:
                 courses_data["years"][current_year] = {
                     "total_credits": 5.0,
                     "semesters": {}
                 }
-            i += 1
-            continue
 
         # Look for semester headers
-        if 'Semester' in line:
-            semester_match = re.search(r'Semester (\d+) \((\w+)\)', line)
-            if semester_match and current_year:
-                semester_num = semester_match.group(1)
-                semester_name = semester_match.group(2)
-                current_semester = f"Semester {semester_num} ({semester_name})"
+        semester_match = re.match(r'Semester (\d+) \((\w+)\)', row[2]) if len(row) > 2 else None
+        if semester_match and current_year:
+            semester_num = semester_match.group(1)
+            semester_name = semester_match.group(2)
+            current_semester = f"Semester {semester_num} ({semester_name})"
+            if current_semester not in courses_data["years"][current_year]["semesters"]:
                 courses_data["years"][current_year]["semesters"][current_semester] = {
                     "course_types": {
                         "core": [],
@@ -89,52 +149,15 @@ def parse_csv_content(content, pathway_name):
                         "breadth": []
                     }
                 }
-            i += 1
-            continue
 
-        # Process course data - look for lines containing course codes
-        if current_year and current_semester and '[A-Z]{4}-' in line:
-            # This might be a course line, let's collect all related lines
-            course_line = line
-
-            # Check if the next few lines are continuations (don't contain YEAR or Semester)
-            j = i + 1
-            while j < len(lines) and lines[j].strip() and 'YEAR' not in lines[j] and 'Semester' not in lines[j]:
-                course_line += ' ' + lines[j].strip()
-                j += 1
-
-            # Try to parse courses from this line
-            # Split by commas but be careful with quoted content
-            parts = course_line.split('","')
-
-            if len(parts) >= 3:
-                # Core course (usually index 2)
-                if len(parts) > 2:
-                    core_course = parse_course_info(parts[2].strip('"'))
-                    if core_course:
-                        courses_data["years"][current_year]["semesters"][current_semester]["course_types"]["core"].append(core_course)
-
-                # Program-specific course (usually index 3)
-                if len(parts) > 3:
-                    prog_course = parse_course_info(parts[3].strip('"'))
-                    if prog_course:
-                        courses_data["years"][current_year]["semesters"][current_semester]["course_types"]["program_specific"].append(prog_course)
-
-                # Open course (usually index 4)
-                if len(parts) > 4:
-                    open_course = parse_course_info(parts[4].strip('"'))
-                    if open_course:
-                        courses_data["years"][current_year]["semesters"][current_semester]["course_types"]["open"].append(open_course)
-
-                # Breadth course (usually index 5)
-                if len(parts) > 5:
-                    breadth_course = parse_course_info(parts[5].strip('"'))
-                    if breadth_course:
-                        courses_data["years"][current_year]["semesters"][current_semester]["course_types"]["breadth"].append(breadth_course)
-
-            i = j
-        else:
-            i += 1
+        # Process course data
+        if current_year and current_semester:
+            course_types = courses_data["years"][current_year]["semesters"][current_semester]["course_types"]
+            for column, course_type in COURSE_TYPE_COLUMNS.items():
+                if column < len(row) and row[column].strip():
+                    course = parse_course_info(row[column])
+                    if course:
+                        course_types[course_type].append(course)
 
     return courses_data
 
@@ -152,16 +175,20 @@ def main():
     for pathway_name, csv_path in csv_files.items():
         print(f"Processing {pathway_name}...")
 
-        with open(csv_path, 'r', encoding='latin-1') as file:
-            content = file.read()
+        with open(csv_path, 'rb') as file:
+            content = decode_csv_bytes(file.read())
 
         json_data = parse_csv_content(content, pathway_name)
         pathways_data[pathway_name] = json_data
 
+    # Build the shared catalogue that every output is written from
+    catalogue = course_catalogue.build_catalogue(pathways_data, "v2")
+
+    for pathway_name in catalogue["pathways"]:
         # Save individual pathway JSON
         output_path = f"pathways/{pathway_name}.json"
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
+            json.dump(course_catalogue.create_pathway_json(catalogue, pathway_name), f, indent=2, ensure_ascii=False)
 
         print(f"Saved {output_path}")
 
@@ -2,37 +2,13 @@ import csv
 import json
 import re
 
+import course_catalogue
+from course_scanner import scan_course_text
+from dedupe_courses import dedupe_catalogue
+
 def parse_course_info(course_text):
     """Parse course information from the CSV text format"""
-    if not course_text or course_text.strip() == "":
-        return None
-
-    # Extract course code and title from the beginning
-    course_match = re.match(r'^([A-Z]{4}-\d{4})\s+(.+?)\s*\(([\d.]+)\s*Credits?\)', course_text.strip())
-    if course_match:
-        course_code = course_match.group(1)
-        course_title = course_match.group(2).strip()
-        credits = float(course_match.group(3))
-
-        # Remove the course code, title, and credits from the text to get description
-        description_text = re.sub(r'^[A-Z]{4}-\d{4}\s+.+\s*\([\d.]+\s*Credits?\)\s*', '', course_text.strip())
-
-        # Extract prerequisites if they exist
-        prereq_match = re.search(r'Requisites?:\s*(.+?)(?:\n|$)', description_text, re.DOTALL)
-        prerequisites = prereq_match.group(1).strip() if prereq_match else None
-
-        # Clean up description by removing prerequisites section
-        description = re.sub(r'Requisites?:\s*.+$', '', description_text, flags=re.MULTILINE).strip()
-
-        return {
-            "code": course_code,
-            "title": course_title,
-            "credits": credits,
-            "description": description,
-            "prerequisites": prerequisites
-        }
-
-    return None
+    return scan_course_text(course_text, hyphen_optional=False, credits_word_optional=False)
 
 def parse_csv_to_json(csv_file_path, pathway_name):
     """Parse CSV file and convert to structured JSON"""
@@ -135,132 +111,11 @@ def parse_csv_to_json(csv_file_path, pathway_name):
 
 def create_comparison_json(pathways_data):
     """Create a comparison JSON that makes it easy to compare across pathways"""
-    comparison_data = {
-        "program": "Digital Futures",
-        "academic_year": "2025/26",
-        "pathways": list(pathways_data.keys()),
-        "comparison": {
-            "by_year": {},
-            "by_course_type": {},
-            "all_courses": []
-        }
-    }
-
-    # Collect all unique courses
-    all_courses = set()
-
-    for pathway_name, pathway_data in pathways_data.items():
-        for year, year_data in pathway_data["years"].items():
-            if year not in comparison_data["comparison"]["by_year"]:
-                comparison_data["comparison"]["by_year"][year] = {}
-
-            for semester, semester_data in year_data["semesters"].items():
-                if semester not in comparison_data["comparison"]["by_year"][year]:
-                    comparison_data["comparison"]["by_year"][year][semester] = {
-                        "core": {},
-                        "program_specific": {},
-                        "open": {},
-                        "breadth": {}
-                    }
-
-                for course_type, courses in semester_data["course_types"].items():
-                    for course in courses:
-                        course_key = f"{course['code']}: {course['title']}"
-                        all_courses.add(course_key)
-
-                        # Add to year/semester comparison
-                        if course_key not in comparison_data["comparison"]["by_year"][year][semester][course_type]:
-                            comparison_data["comparison"]["by_year"][year][semester][course_type][course_key] = []
-
-                        comparison_data["comparison"]["by_year"][year][semester][course_type][course_key].append(pathway_name)
-
-                        # Add to course type comparison
-                        if course_type not in comparison_data["comparison"]["by_course_type"]:
-                            comparison_data["comparison"]["by_course_type"][course_type] = {}
-
-                        if course_key not in comparison_data["comparison"]["by_course_type"][course_type]:
-                            comparison_data["comparison"]["by_course_type"][course_type][course_key] = {
-                                "details": course,
-                                "offered_in": []
-                            }
-
-                        if pathway_name not in comparison_data["comparison"]["by_course_type"][course_type][course_key]["offered_in"]:
-                            comparison_data["comparison"]["by_course_type"][course_type][course_key]["offered_in"].append(pathway_name)
-
-    # Convert set to sorted list
-    comparison_data["comparison"]["all_courses"] = sorted(list(all_courses))
-
-    return comparison_data
+    return course_catalogue.create_comparison_json(course_catalogue.build_catalogue(pathways_data, "v2"))
 
 def create_searchable_index(pathways_data):
     """Create a searchable index for easy querying"""
-    searchable_index = {
-        "program": "Digital Futures",
-        "last_updated": "2025-09-02",
-        "search_index": {
-            "courses_by_code": {},
-            "courses_by_title": {},
-            "courses_by_keywords": {},
-            "courses_by_pathway": {},
-            "courses_by_year": {},
-            "courses_by_course_type": {}
-        }
-    }
-
-    for pathway_name, pathway_data in pathways_data.items():
-        searchable_index["search_index"]["courses_by_pathway"][pathway_name] = []
-
-        for year, year_data in pathway_data["years"].items():
-            if year not in searchable_index["search_index"]["courses_by_year"]:
-                searchable_index["search_index"]["courses_by_year"][year] = []
-
-            for semester, semester_data in year_data["semesters"].items():
-                for course_type, courses in semester_data["course_types"].items():
-                    if course_type not in searchable_index["search_index"]["courses_by_course_type"]:
-                        searchable_index["search_index"]["courses_by_course_type"][course_type] = []
-
-                    for course in courses:
-                        course_info = {
-                            "code": course["code"],
-                            "title": course["title"],
-                            "credits": course["credits"],
-                            "description": course["description"],
-                            "prerequisites": course["prerequisites"],
-                            "pathway": pathway_name,
-                            "year": year,
-                            "semester": semester,
-                            "course_type": course_type
-                        }
-
-                        # Index by course code
-                        searchable_index["search_index"]["courses_by_code"][course["code"]] = course_info
-
-                        # Index by title keywords
-                        title_words = course["title"].lower().split()
-                        for word in title_words:
-                            if len(word) > 2:  # Skip very short words
-                                if word not in searchable_index["search_index"]["courses_by_title"]:
-                                    searchable_index["search_index"]["courses_by_title"][word] = []
-                                searchable_index["search_index"]["courses_by_title"][word].append(course_info)
-
-                        # Index by description keywords
-                        desc_words = course["description"].lower().split()
-                        for word in desc_words:
-                            if len(word) > 3:  # Skip short words
-                                if word not in searchable_index["search_index"]["courses_by_keywords"]:
-                                    searchable_index["search_index"]["courses_by_keywords"][word] = []
-                                searchable_index["search_index"]["courses_by_keywords"][word].append(course_info)
-
-                        # Add to pathway list
-                        searchable_index["search_index"]["courses_by_pathway"][pathway_name].append(course_info)
-
-                        # Add to year list
-                        searchable_index["search_index"]["courses_by_year"][year].append(course_info)
-
-                        # Add to course type list
-                        searchable_index["search_index"]["courses_by_course_type"][course_type].append(course_info)
-
-    return searchable_index
+    return course_catalogue.create_searchable_index(course_catalogue.build_catalogue(pathways_data, "v2"))
 
 def main():
     """Main function to convert CSV files to JSON"""
@@ -278,16 +133,26 @@ def main():
         json_data = parse_csv_to_json(csv_path, pathway_name)
         pathways_data[pathway_name] = json_data
 
+    # Build the shared catalogue that every output is written from
+    catalogue = course_catalogue.build_catalogue(pathways_data, "v2")
+
+    # Merge near-duplicate course records before anything is written
+    print("Deduplicating courses...")
+    dedupe_report = dedupe_catalogue(catalogue)
+    print(f"Merged {len(dedupe_report['merged'])} duplicate courses, "
+          f"flagged {len(dedupe_report['flagged'])} possible cross-listings")
+
+    for pathway_name in catalogue["pathways"]:
         # Save individual pathway JSON
         output_path = f"pathways/{pathway_name}.json"
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
+            json.dump(course_catalogue.create_pathway_json(catalogue, pathway_name), f, indent=2, ensure_ascii=False)
 
         print(f"Saved {output_path}")
 
     # Create comparison JSON
     print("Creating comparison data...")
-    comparison_data = create_comparison_json(pathways_data)
+    comparison_data = course_catalogue.create_comparison_json(catalogue)
 
     # Save comparison JSON
     with open("pathways/pathway-comparison.json", 'w', encoding='utf-8') as f:
@@ -297,7 +162,7 @@ def main():
 
     # Create searchable index
     print("Creating searchable index...")
-    searchable_index = create_searchable_index(pathways_data)
+    searchable_index = course_catalogue.create_searchable_index(catalogue)
 
     # Save searchable index
     with open("pathways/searchable-index.json", 'w', encoding='utf-8') as f:
@@ -2,6 +2,8 @@ import json
 import re
 from bs4 import BeautifulSoup
 
+import course_catalogue
+
 def parse_html_to_json(html_file_path):
     """Parse the HTML file and extract course data into structured JSON format."""
 
@@ -92,81 +94,11 @@ def parse_html_to_json(html_file_path):
 
 def create_comparison_json(pathways_data):
     """Create a comparison JSON that shows courses across all pathways."""
-
-    comparison_data = {
-        'pathways': list(pathways_data.keys()),
-        'comparison': {}
-    }
-
-    # Collect all unique course codes
-    all_courses = set()
-    for pathway, data in pathways_data.items():
-        for year, year_data in data['years'].items():
-            for course_type, courses in year_data.items():
-                for course in courses:
-                    if course['code']:
-                        all_courses.add(course['code'])
-
-    # Build comparison structure
-    for course_code in sorted(all_courses):
-        comparison_data['comparison'][course_code] = {}
-
-        for pathway in pathways_data.keys():
-            comparison_data['comparison'][course_code][pathway] = []
-
-            # Find this course in the pathway
-            for year, year_data in pathways_data[pathway]['years'].items():
-                for course_type, courses in year_data.items():
-                    for course in courses:
-                        if course['code'] == course_code:
-                            comparison_data['comparison'][course_code][pathway].append({
-                                'year': year,
-                                'type': course_type,
-                                'title': course['title'],
-                                'credits': course['credits'],
-                                'description': course['description']
-                            })
-
-    return comparison_data
+    return course_catalogue.create_code_comparison_json(course_catalogue.build_catalogue(pathways_data, "html"))
 
 def create_searchable_index(pathways_data):
     """Create a searchable index of all courses."""
-
-    index_data = {
-        'courses': {},
-        'keywords': {}
-    }
-
-    course_id = 1
-    for pathway, data in pathways_data.items():
-        for year, year_data in data['years'].items():
-            for course_type, courses in year_data.items():
-                for course in courses:
-                    if course['code']:
-                        index_data['courses'][course['code']] = {
-                            'id': course_id,
-                            'pathway': pathway,
-                            'year': year,
-                            'type': course_type,
-                            'title': course['title'],
-                            'credits': course['credits'],
-                            'description': course['description']
-                        }
-
-                        # Extract keywords from title and description
-                        text = f"{course['title']} {course['description']}".lower()
-                        words = re.findall(r'\b\w+\b', text)
-
-                        for word in words:
-                            if len(word) > 2:  # Skip very short words
-                                if word not in index_data['keywords']:
-                                    index_data['keywords'][word] = []
-                                if course['code'] not in index_data['keywords'][word]:
-                                    index_data['keywords'][word].append(course['code'])
-
-                        course_id += 1
-
-    return index_data
+    return course_catalogue.create_keyword_index(course_catalogue.build_catalogue(pathways_data, "html"))
 
 def main():
     html_file = 'index.html'
@@ -174,23 +106,26 @@ def main():
     print("Parsing HTML file...")
     pathways_data = parse_html_to_json(html_file)
 
+    # Build the shared catalogue that every output is written from
+    catalogue = course_catalogue.build_catalogue(pathways_data, "html")
+
     # Save individual pathway files
-    for pathway_name, data in pathways_data.items():
+    for pathway_name in catalogue["pathways"]:
         filename = f"pathways/{pathway_name}.json"
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            json.dump(course_catalogue.create_pathway_json(catalogue, pathway_name), f, indent=2, ensure_ascii=False)
         print(f"Saved {filename}")
 
     # Create and save comparison file
     print("Creating comparison data...")
-    comparison_data = create_comparison_json(pathways_data)
+    comparison_data = course_catalogue.create_code_comparison_json(catalogue)
     with open('pathways/pathway-comparison.json', 'w', encoding='utf-8') as f:
         json.dump(comparison_data, f, indent=2, ensure_ascii=False)
     print("Saved pathways/pathway-comparison.json")
 
     # Create and save searchable index
     print("Creating searchable index...")
-    index_data = create_searchable_index(pathways_data)
+    index_data = course_catalogue.create_keyword_index(catalogue)
     with open('pathways/searchable-index.json', 'w', encoding='utf-8') as f:
         json.dump(index_data, f, indent=2, ensure_ascii=False)
     print("Saved pathways/searchable-index.json")
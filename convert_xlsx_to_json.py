@@ -0,0 +1,89 @@
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from openpyxl import load_workbook
+
+import convert_csv_to_json
+from pathway_csv import parse_csv_rows
+
+# Course cells live in columns 3-6, so parse_csv_rows needs at least 7 cells per row
+ROW_WIDTH = 7
+
+def pathway_name_for_sheet(sheet_title):
+    """Turn a sheet title like 'Creative Technologist' into the pathway name 'creative-technologist'"""
+    return re.sub(r'[^a-z0-9]+', '-', sheet_title.lower()).strip('-')
+
+def cell_text(value):
+    """Render a cell value the way a CSV export would"""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def iter_sheet_rows(worksheet):
+    """Stream a worksheet's rows as lists of strings, padded to ROW_WIDTH"""
+    for values in worksheet.iter_rows(values_only=True):
+        row = [cell_text(value) for value in values]
+        if len(row) < ROW_WIDTH:
+            row.extend([""] * (ROW_WIDTH - len(row)))
+        yield row
+
+def parse_sheet(task):
+    """Parse one sheet into (pathway name, pathway JSON, unparsed cells) (runs in a worker process)"""
+    workbook_path, sheet_title, pathway_name = task
+
+    # Read-only mode streams rows from the zip instead of loading the whole sheet
+    workbook = load_workbook(workbook_path, read_only=True, data_only=True)
+    try:
+        unparsed = []
+        return pathway_name, parse_csv_rows(iter_sheet_rows(workbook[sheet_title]), pathway_name, unparsed), unparsed
+    finally:
+        workbook.close()
+
+def parse_workbook(workbook_path, pathway_names=None, workers=None):
+    """Parse every sheet of a workbook in parallel, one pathway per sheet.
+
+    Sheet titles are mapped to pathway names with pathway_name_for_sheet; when
+    pathway_names is given, other sheets are skipped. Each worker opens the
+    workbook itself and streams a single sheet, so memory is bounded by the
+    number of workers rather than the size of the workbook. Returns
+    (pathways_data, unparsed cells of every sheet).
+    """
+    workbook = load_workbook(workbook_path, read_only=True)
+    try:
+        sheet_titles = workbook.sheetnames
+    finally:
+        workbook.close()
+
+    tasks = [
+        (workbook_path, sheet_title, pathway_name_for_sheet(sheet_title))
+        for sheet_title in sheet_titles
+        if pathway_names is None or pathway_name_for_sheet(sheet_title) in pathway_names
+    ]
+
+    pathways_data = {}
+    unparsed_cells = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for pathway_name, pathway_data, unparsed in executor.map(parse_sheet, tasks):
+            pathways_data[pathway_name] = pathway_data
+            unparsed_cells.extend(unparsed)
+
+    return pathways_data, unparsed_cells
+
+def main():
+    """Convert a pathway workbook with one sheet per pathway, writing the same outputs as the CSV converter"""
+    if len(sys.argv) != 2:
+        print("Usage: python convert_xlsx_to_json.py WORKBOOK.xlsx")
+        sys.exit(1)
+
+    print(f"Parsing {sys.argv[1]}...")
+    pathways_data, unparsed_cells = parse_workbook(sys.argv[1])
+    for pathway_name in pathways_data:
+        print(f"Processed {pathway_name}")
+
+    convert_csv_to_json.write_outputs(pathways_data, unparsed_cells)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,569 @@
+import json
+import re
+from pathlib import Path
+
+import autocomplete
+from text_analyzer import analyze
+
+# Shared in-memory representation of a parsed catalogue.
+#
+# Every converter frontend (CSV v1, CSV v2, "simple", HTML) parses its input
+# into the nested pathway dicts it always has, then hands them to
+# build_catalogue(). The writers below are backends over the result, so
+# comparison, search index and pathway JSON are all computed from one place.
+#
+# catalogue = {
+#     "program": "Digital Futures",
+#     "academic_year": "2025/26",
+#     "layout": "v1" | "v2" | "html",       # nesting of the source pathway dicts
+#     "courses": [course, ...],             # course table, indexed by course id
+#     "course_keys": ["CODE: Title", ...],  # computed once per course
+#     "pathways": {
+#         name: {
+#             "meta": {...},                # top-level keys other than "years"
+#             "years": {year: {"meta": {...}, "cells": [(semester, course_type), ...]}}
+#         }
+#     },
+#     "placements": [(pathway, year, semester, course_type, course_id), ...]
+# }
+#
+# Year, semester and course type keys are kept exactly as the frontend wrote
+# them, so each backend reproduces its converter's existing output. The HTML
+# layout has no semester level and uses None.
+
+LAYOUTS = ("v1", "v2", "html")
+
+# Bump whenever the bundle layout changes so the site can detect stale files
+BUNDLE_SCHEMA_VERSION = 3
+
+# Grid column headings used by the site
+COURSE_TYPE_LABELS = {
+    "core_courses": "Core Courses",
+    "program_specific_electives": "Program Specific Electives",
+    "open_electives": "Open Electives",
+    "breadth_electives": "Breadth Electives"
+}
+
+# Course type keys used by the v2 converter, mapped onto the keys the site reads
+COURSE_TYPE_KEYS = {
+    "core": "core_courses",
+    "program_specific": "program_specific_electives",
+    "open": "open_electives",
+    "breadth": "breadth_electives"
+}
+
+def iter_cells(pathway_data, layout):
+    """Yield (year, year_meta, semester, course_type, courses) for every cell of a pathway"""
+    for year, year_data in pathway_data["years"].items():
+        if layout == "v1":
+            # "1" -> fall -> core_courses
+            for semester, semester_data in year_data.items():
+                for course_type, courses in semester_data.items():
+                    yield year, {}, semester, course_type, courses
+        elif layout == "v2":
+            # "Year 1" -> semesters -> "Semester 1 (Fall)" -> course_types -> core
+            year_meta = {key: value for key, value in year_data.items() if key != "semesters"}
+            for semester, semester_data in year_data["semesters"].items():
+                for course_type, courses in semester_data["course_types"].items():
+                    yield year, year_meta, semester, course_type, courses
+            if not year_data["semesters"]:
+                yield year, year_meta, None, None, []
+        else:
+            # "1" -> core_courses, no semester level
+            for course_type, courses in year_data.items():
+                yield year, {}, None, course_type, courses
+            if not year_data:
+                yield year, {}, None, None, []
+
+def build_catalogue(pathways_data, layout, program="Digital Futures", academic_year="2025/26"):
+    """Build the shared catalogue representation from parsed pathway dicts"""
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown layout: {layout}")
+
+    catalogue = {
+        "program": program,
+        "academic_year": academic_year,
+        "layout": layout,
+        "courses": [],
+        "course_keys": [],
+        "pathways": {},
+        "placements": []
+    }
+
+    course_ids = {}
+
+    for pathway_name, pathway_data in pathways_data.items():
+        pathway = {
+            "meta": {key: value for key, value in pathway_data.items() if key != "years"},
+            "years": {}
+        }
+        catalogue["pathways"][pathway_name] = pathway
+
+        for year, year_meta, semester, course_type, courses in iter_cells(pathway_data, layout):
+            if year not in pathway["years"]:
+                pathway["years"][year] = {"meta": year_meta, "cells": []}
+            if course_type is None:
+                continue
+            pathway["years"][year]["cells"].append((semester, course_type))
+
+            for course in courses:
+                # Identical records share one course table entry
+                identity = tuple(course.items())
+                course_id = course_ids.get(identity)
+                if course_id is None:
+                    course_id = len(catalogue["courses"])
+                    course_ids[identity] = course_id
+                    catalogue["courses"].append(course)
+                    catalogue["course_keys"].append(f"{course['code']}: {course['title']}")
+
+                catalogue["placements"].append((pathway_name, year, semester, course_type, course_id))
+
+    return catalogue
+
+def reindex_courses(catalogue):
+    """Merge course table entries that became identical after an edit and refresh their keys"""
+    course_ids = {}
+    courses = []
+    new_ids = []
+
+    for course in catalogue["courses"]:
+        identity = tuple(course.items())
+        if identity not in course_ids:
+            course_ids[identity] = len(courses)
+            courses.append(course)
+        new_ids.append(course_ids[identity])
+
+    catalogue["courses"] = courses
+    catalogue["course_keys"] = [f"{course['code']}: {course['title']}" for course in courses]
+    catalogue["placements"] = [
+        (pathway_name, year, semester, course_type, new_ids[course_id])
+        for pathway_name, year, semester, course_type, course_id in catalogue["placements"]
+    ]
+
+def detect_layout(pathways_data):
+    """Guess the layout of parsed pathway dicts from the nesting of their first year"""
+    for pathway_data in pathways_data.values():
+        for year_data in pathway_data["years"].values():
+            if "semesters" in year_data:
+                return "v2"
+            for value in year_data.values():
+                return "html" if isinstance(value, list) else "v1"
+    return "v1"
+
+def load_catalogue(path, pathway_names=None):
+    """Load the pathway JSON files of one catalogue build from a directory into a catalogue.
+
+    pathway_names, when given, selects the pathways and their order;
+    otherwise every pathway file is loaded in file name order.
+    """
+    pathways_data = {}
+
+    for json_path in sorted(Path(path).glob("*.json")):
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        # Skip comparison, index and other non-pathway files
+        if not isinstance(data, dict) or "years" not in data:
+            continue
+
+        pathways_data[data.get("pathway", json_path.stem)] = data
+
+    if pathway_names is not None:
+        pathways_data = {name: pathways_data[name] for name in pathway_names}
+
+    return build_catalogue(pathways_data, detect_layout(pathways_data))
+
+def iter_placements(catalogue):
+    """Yield (pathway, year, semester, course_type, course_id) with keys normalized across layouts.
+
+    Years become their number ("Year 1" -> "1"), v2 semesters their season
+    ("Semester 1 (Fall)" -> "fall") and v2 course types the site's keys
+    ("core" -> "core_courses"), so catalogues of any layout compare equal.
+    """
+    layout = catalogue["layout"]
+
+    for pathway_name, year, semester, course_type, course_id in catalogue["placements"]:
+        year_match = re.search(r'\d+', year)
+        year_key = year_match.group(0) if year_match else year
+
+        if layout == "v2":
+            semester_match = re.search(r'\((\w+)\)', semester)
+            semester = semester_match.group(1).lower() if semester_match else semester
+            course_type = COURSE_TYPE_KEYS.get(course_type, course_type)
+
+        yield pathway_name, year_key, semester, course_type, course_id
+
+def iter_pathway_placements(catalogue):
+    """Yield (pathway, year, cells, placements) grouped in document order"""
+    placements = catalogue["placements"]
+    position = 0
+
+    for pathway_name, pathway in catalogue["pathways"].items():
+        for year, year_entry in pathway["years"].items():
+            start = position
+            while (position < len(placements)
+                   and placements[position][0] == pathway_name
+                   and placements[position][1] == year):
+                position += 1
+            yield pathway_name, year, year_entry["cells"], placements[start:position]
+
+def create_pathway_json(catalogue, pathway_name, course_ids=False):
+    """Rebuild a pathway's JSON in the layout it was parsed from.
+
+    With course_ids=True each cell lists course table ids instead of course objects.
+    """
+    pathway = catalogue["pathways"][pathway_name]
+    layout = catalogue["layout"]
+    courses = catalogue["courses"]
+
+    pathway_json = dict(pathway["meta"])
+    pathway_json["years"] = {}
+    cell_lists = {}
+
+    for year, year_entry in pathway["years"].items():
+        if layout == "v1":
+            year_json = {}
+            for semester, course_type in year_entry["cells"]:
+                year_json.setdefault(semester, {})[course_type] = cell_lists[(year, semester, course_type)] = []
+        elif layout == "v2":
+            year_json = dict(year_entry["meta"])
+            year_json["semesters"] = {}
+            for semester, course_type in year_entry["cells"]:
+                semester_json = year_json["semesters"].setdefault(semester, {"course_types": {}})
+                semester_json["course_types"][course_type] = cell_lists[(year, semester, course_type)] = []
+        else:
+            year_json = {}
+            for semester, course_type in year_entry["cells"]:
+                year_json[course_type] = cell_lists[(year, semester, course_type)] = []
+
+        pathway_json["years"][year] = year_json
+
+    for placement_pathway, year, semester, course_type, course_id in catalogue["placements"]:
+        if placement_pathway == pathway_name:
+            cell_lists[(year, semester, course_type)].append(course_id if course_ids else courses[course_id])
+
+    return pathway_json
+
+def create_comparison_json(catalogue):
+    """Create a comparison JSON that makes it easy to compare across pathways"""
+    comparison_data = {
+        "program": catalogue["program"],
+        "academic_year": catalogue["academic_year"],
+        "pathways": list(catalogue["pathways"].keys()),
+        "comparison": {
+            "by_year": {},
+            "by_course_type": {},
+            "all_courses": []
+        }
+    }
+
+    by_year = comparison_data["comparison"]["by_year"]
+    by_course_type = comparison_data["comparison"]["by_course_type"]
+    courses = catalogue["courses"]
+    course_keys = catalogue["course_keys"]
+
+    for pathway_name, year, cells, placements in iter_pathway_placements(catalogue):
+        year_comparison = by_year.setdefault(year, {})
+        for semester, course_type in cells:
+            year_comparison.setdefault(semester, {}).setdefault(course_type, {})
+
+        for _, _, semester, course_type, course_id in placements:
+            course_key = course_keys[course_id]
+
+            # Add to year/semester comparison
+            year_comparison[semester][course_type].setdefault(course_key, []).append(pathway_name)
+
+            # Add to course type comparison
+            type_comparison = by_course_type.setdefault(course_type, {})
+            if course_key not in type_comparison:
+                type_comparison[course_key] = {
+                    "details": courses[course_id],
+                    "offered_in": []
+                }
+
+            if pathway_name not in type_comparison[course_key]["offered_in"]:
+                type_comparison[course_key]["offered_in"].append(pathway_name)
+
+    comparison_data["comparison"]["all_courses"] = sorted(set(course_keys))
+
+    return comparison_data
+
+def get_course_words(catalogue):
+    """Return per-course (title terms, description terms), analyzed once per catalogue"""
+    if "course_words" not in catalogue:
+        title_words = [analyze(course["title"]) for course in catalogue["courses"]]
+        desc_words = [analyze(course["description"]) for course in catalogue["courses"]]
+        catalogue["course_words"] = (title_words, desc_words)
+
+    return catalogue["course_words"]
+
+def create_searchable_index(catalogue, last_updated="2025-09-02"):
+    """Create a searchable index for easy querying"""
+    searchable_index = {
+        "program": catalogue["program"],
+        "last_updated": last_updated,
+        "search_index": {
+            "courses_by_code": {},
+            "courses_by_title": {},
+            "courses_by_keywords": {},
+            "courses_by_pathway": {},
+            "courses_by_year": {},
+            "courses_by_course_type": {}
+        }
+    }
+
+    search_index = searchable_index["search_index"]
+    courses = catalogue["courses"]
+    title_words, desc_words = get_course_words(catalogue)
+
+    # Every pathway gets a list, even one without any years
+    for pathway_name in catalogue["pathways"]:
+        search_index["courses_by_pathway"][pathway_name] = []
+
+    for pathway_name, year, cells, placements in iter_pathway_placements(catalogue):
+        pathway_list = search_index["courses_by_pathway"][pathway_name]
+        year_list = search_index["courses_by_year"].setdefault(year, [])
+        for semester, course_type in cells:
+            search_index["courses_by_course_type"].setdefault(course_type, [])
+
+        for _, _, semester, course_type, course_id in placements:
+            course = courses[course_id]
+            course_info = {
+                "code": course["code"],
+                "title": course["title"],
+                "credits": course["credits"],
+                "description": course["description"],
+                "prerequisites": course["prerequisites"],
+                "pathway": pathway_name,
+                "year": year,
+                "semester": semester,
+                "course_type": course_type
+            }
+
+            # Index by course code
+            search_index["courses_by_code"][course["code"]] = course_info
+
+            # Index by title keywords
+            for word in dict.fromkeys(title_words[course_id]):
+                search_index["courses_by_title"].setdefault(word, []).append(course_info)
+
+            # Index by description keywords
+            for word in dict.fromkeys(desc_words[course_id]):
+                search_index["courses_by_keywords"].setdefault(word, []).append(course_info)
+
+            pathway_list.append(course_info)
+            year_list.append(course_info)
+            search_index["courses_by_course_type"][course_type].append(course_info)
+
+    return searchable_index
+
+def create_code_comparison_json(catalogue):
+    """Create a comparison keyed by course code, listing where each pathway places it"""
+    comparison_data = {
+        "pathways": list(catalogue["pathways"].keys()),
+        "comparison": {}
+    }
+
+    courses = catalogue["courses"]
+    offered = {}
+
+    # Group placements by code in one pass instead of rescanning every pathway per code
+    for pathway_name, year, semester, course_type, course_id in catalogue["placements"]:
+        course = courses[course_id]
+        if not course["code"]:
+            continue
+        if course["code"] not in offered:
+            offered[course["code"]] = {name: [] for name in catalogue["pathways"]}
+        offered[course["code"]][pathway_name].append({
+            "year": year,
+            "type": course_type,
+            "title": course["title"],
+            "credits": course["credits"],
+            "description": course["description"]
+        })
+
+    for course_code in sorted(offered):
+        comparison_data["comparison"][course_code] = offered[course_code]
+
+    return comparison_data
+
+def create_keyword_index(catalogue):
+    """Create a keyword index over course codes"""
+    index_data = {
+        "courses": {},
+        "keywords": {}
+    }
+
+    courses = catalogue["courses"]
+    keyword_sets = {}
+    course_id_counter = 1
+
+    # Word lists are shared by every placement of the same course
+    course_words = {}
+
+    for pathway_name, year, semester, course_type, course_id in catalogue["placements"]:
+        course = courses[course_id]
+        if not course["code"]:
+            continue
+
+        index_data["courses"][course["code"]] = {
+            "id": course_id_counter,
+            "pathway": pathway_name,
+            "year": year,
+            "type": course_type,
+            "title": course["title"],
+            "credits": course["credits"],
+            "description": course["description"]
+        }
+
+        if course_id not in course_words:
+            course_words[course_id] = analyze(course["title"]) + analyze(course["description"])
+
+        for word in course_words[course_id]:
+            if word not in index_data["keywords"]:
+                index_data["keywords"][word] = []
+                keyword_sets[word] = set()
+            if course["code"] not in keyword_sets[word]:
+                keyword_sets[word].add(course["code"])
+                index_data["keywords"][word].append(course["code"])
+
+        course_id_counter += 1
+
+    return index_data
+
+def create_view_model_json(catalogue, pathway_name):
+    """Create a render-ready grid for one pathway.
+
+    Rows are year/semester pairs in year order, columns are course types, and
+    each cell carries its course ids sorted by code together with the credit
+    total and course count the site shows as badges.
+    """
+    pathway = catalogue["pathways"][pathway_name]
+    courses = catalogue["courses"]
+
+    columns = []
+    rows = []
+    cells = {}
+
+    year_numbers = {year: int(re.search(r'\d+', year).group(0)) for year in pathway["years"]}
+
+    for year in sorted(pathway["years"], key=year_numbers.get):
+        row_index = {}
+        for semester, course_type in pathway["years"][year]["cells"]:
+            if course_type not in columns:
+                columns.append(course_type)
+            if semester not in row_index:
+                row_index[semester] = {
+                    "year": year,
+                    "semester": semester,
+                    "label": f"Year {year_numbers[year]} - {semester.title()}" if semester else f"Year {year_numbers[year]}",
+                    "cells": {}
+                }
+                rows.append(row_index[semester])
+            row_index[semester]["cells"][course_type] = cells[(year, semester, course_type)] = []
+
+    for placement_pathway, year, semester, course_type, course_id in catalogue["placements"]:
+        if placement_pathway == pathway_name:
+            cells[(year, semester, course_type)].append(course_id)
+
+    for row in rows:
+        row["cells"] = [
+            {
+                "course_type": course_type,
+                "course_ids": sorted(row["cells"].get(course_type, []), key=lambda course_id: courses[course_id]["code"]),
+                "course_count": len(row["cells"].get(course_type, [])),
+                "total_credits": sum((courses[course_id]["credits"] for course_id in row["cells"].get(course_type, [])), 0.0)
+            }
+            for course_type in columns
+        ]
+
+    return {
+        "pathway": pathway_name,
+        "name": pathway["meta"].get("name", pathway_name),
+        "columns": [
+            {"key": course_type, "label": COURSE_TYPE_LABELS.get(course_type, course_type.replace('_', ' ').title())}
+            for course_type in columns
+        ],
+        "rows": rows
+    }
+
+def create_bundle_json(catalogue, last_updated="2025-09-02"):
+    """Create a single deduplicated bundle of pathways, comparison and search index.
+
+    Course objects appear once in "courses". Pathways list course ids per cell,
+    "views" holds the render-ready grid for each pathway, "autocomplete" the
+    prefix index over codes and title words, "placements" lists
+    [pathway, year, semester, course_type, course_id], and the comparison and
+    index refer to those tables by position.
+    """
+    courses = catalogue["courses"]
+    placements = catalogue["placements"]
+    title_words, desc_words = get_course_words(catalogue)
+
+    bundle = {
+        "schema_version": BUNDLE_SCHEMA_VERSION,
+        "program": catalogue["program"],
+        "academic_year": catalogue["academic_year"],
+        "last_updated": last_updated,
+        "courses": courses,
+        "placements": [list(placement) for placement in placements],
+        "pathways": {
+            pathway_name: create_pathway_json(catalogue, pathway_name, course_ids=True)
+            for pathway_name in catalogue["pathways"]
+        },
+        "views": {
+            pathway_name: create_view_model_json(catalogue, pathway_name)
+            for pathway_name in catalogue["pathways"]
+        },
+        "autocomplete": autocomplete.create_autocomplete_index(catalogue),
+        "comparison": {
+            "by_year": {},
+            "by_course_type": {}
+        },
+        "index": {
+            "courses_by_code": {},
+            "courses_by_title": {},
+            "courses_by_keywords": {},
+            "courses_by_pathway": {},
+            "courses_by_year": {},
+            "courses_by_course_type": {}
+        }
+    }
+
+    by_year = bundle["comparison"]["by_year"]
+    by_course_type = bundle["comparison"]["by_course_type"]
+    index = bundle["index"]
+
+    # Every pathway gets a list, even one without any years
+    for pathway_name in catalogue["pathways"]:
+        index["courses_by_pathway"][pathway_name] = []
+
+    placement_id = 0
+    for pathway_name, year, cells, year_placements in iter_pathway_placements(catalogue):
+        year_comparison = by_year.setdefault(year, {})
+        index["courses_by_year"].setdefault(year, [])
+        for semester, course_type in cells:
+            year_comparison.setdefault(semester, {}).setdefault(course_type, {})
+            index["courses_by_course_type"].setdefault(course_type, [])
+
+        for _, _, semester, course_type, course_id in year_placements:
+            # Comparison keyed by course id rather than "CODE: Title"
+            year_comparison[semester][course_type].setdefault(course_id, []).append(pathway_name)
+
+            offered_in = by_course_type.setdefault(course_type, {}).setdefault(course_id, [])
+            if pathway_name not in offered_in:
+                offered_in.append(pathway_name)
+
+            # Index entries refer to placements
+            index["courses_by_code"][courses[course_id]["code"]] = placement_id
+            for word in dict.fromkeys(title_words[course_id]):
+                index["courses_by_title"].setdefault(word, []).append(placement_id)
+            for word in dict.fromkeys(desc_words[course_id]):
+                index["courses_by_keywords"].setdefault(word, []).append(placement_id)
+            index["courses_by_pathway"][pathway_name].append(placement_id)
+            index["courses_by_year"][year].append(placement_id)
+            index["courses_by_course_type"][course_type].append(placement_id)
+
+            placement_id += 1
+
+    return bundle
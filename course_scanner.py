@@ -0,0 +1,226 @@
+import bisect
+
+# Hand-written replacement for the course header regexes in the converters:
+#
+#   ^([A-Z]{4}-?\d{4})\s+(.+?)\s*\(([\d.]+)\s*(?:Credits?)?\)
+#
+# The regex tries every title length, and for each one rescans the following
+# whitespace, so long cells full of parentheses or spaces backtrack badly.
+# The scanner below visits each character a bounded number of times.
+
+UPPERCASE = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+def skip_space(text, position):
+    """Return the first index at or after position that is not whitespace"""
+    length = len(text)
+    while position < length and text[position].isspace():
+        position += 1
+    return position
+
+def scan_code(text, hyphen_optional):
+    """Return the index after a leading XXXX-9999 / XXXX9999 code, or -1"""
+    if len(text) < 8 or not all(char in UPPERCASE for char in text[:4]):
+        return -1
+
+    position = 4
+    if text[position] == '-':
+        position += 1
+    elif not hyphen_optional:
+        return -1
+
+    digits = text[position:position + 4]
+    if len(digits) != 4 or not digits.isdecimal():
+        return -1
+
+    return position + 4
+
+def scan_credit_parens(text, start, credits_word_optional):
+    """Find every '(0.5 Credits)' group after start.
+
+    Returns (open_index, number_text, end_index) tuples in order. Each
+    character is examined by at most one group, since a digit/whitespace
+    run ends at the next '('.
+    """
+    groups = []
+    length = len(text)
+    position = text.find('(', start)
+
+    while position != -1:
+        index = position + 1
+        while index < length and (text[index].isdecimal() or text[index] == '.'):
+            index += 1
+        number_end = index
+
+        if number_end > position + 1:
+            index = skip_space(text, index)
+            end = -1
+            if text.startswith("Credits)", index):
+                end = index + 8
+            elif text.startswith("Credit)", index):
+                end = index + 7
+            elif credits_word_optional and text.startswith(")", index):
+                end = index + 1
+
+            if end != -1:
+                groups.append((position, text[position + 1:number_end], end))
+
+        position = text.find('(', max(position + 1, number_end))
+
+    return groups
+
+def whitespace_start(text, position, limit):
+    """Return the start of the whitespace run that ends just before position"""
+    while position > limit and text[position - 1].isspace():
+        position -= 1
+    return position
+
+def scan_header(text, hyphen_optional=True, credits_word_optional=True):
+    """Split a stripped course cell into (code, title, number, description start).
+
+    Matches the regex semantics exactly: the whitespace after the code is
+    taken greedily, the title is the shortest single-line run before the
+    first credit group, and the description starts after the last credit
+    group reachable from the title's line.
+    """
+    code_end = scan_code(text, hyphen_optional)
+    if code_end == -1:
+        return None
+
+    title_start = skip_space(text, code_end)
+    if title_start == code_end:
+        return None
+
+    groups = scan_credit_parens(text, code_end, credits_word_optional)
+    if not groups:
+        return None
+
+    ws_starts = {}
+
+    def group_ws_start(group_index):
+        if group_index not in ws_starts:
+            ws_starts[group_index] = whitespace_start(text, groups[group_index][0], code_end)
+        return ws_starts[group_index]
+
+    line_end = text.find('\n', title_start)
+    if line_end == -1:
+        line_end = len(text)
+
+    group_positions = [group[0] for group in groups]
+
+    # Back the title start off one character at a time, as \s+ would
+    for start in range(title_start, code_end, -1):
+        if start < title_start and text[start] == '\n':
+            line_end = start
+
+        group_index = bisect.bisect_left(group_positions, start + 1)
+        if group_index == len(groups) or start >= len(text):
+            continue
+
+        title_end = max(start + 1, group_ws_start(group_index))
+        if title_end > line_end:
+            continue
+
+        # The description follows the last group whose leading whitespace starts on the title line
+        last_index = group_index
+        while last_index + 1 < len(groups) and group_ws_start(last_index + 1) <= line_end:
+            last_index += 1
+
+        return (
+            text[:code_end],
+            text[start:title_end],
+            groups[group_index][1],
+            skip_space(text, groups[last_index][2])
+        )
+
+    return None
+
+def find_requisites_label(text, position):
+    """Return (start, end) of the next 'Requisite:' / 'Requisites:' at or after position"""
+    while True:
+        start = text.find("Requisite", position)
+        if start == -1:
+            return None
+
+        end = start + 9
+        if text.startswith("s:", end):
+            return start, end + 2
+        if text.startswith(":", end):
+            return start, end + 1
+
+        position = start + 1
+
+def scan_prerequisites(text):
+    """Return the rest of the line after the first 'Requisites:' label, or None"""
+    position = 0
+    length = len(text)
+
+    while True:
+        label = find_requisites_label(text, position)
+        if label is None:
+            return None
+
+        start, end = label
+        value_start = skip_space(text, end)
+        if value_start < length:
+            value_end = text.find('\n', value_start + 1)
+            return text[value_start:length if value_end == -1 else value_end].strip()
+        if value_start > end:
+            # Only whitespace follows, which strips to nothing
+            return ""
+
+        position = start + 1
+
+def remove_requisites(text):
+    """Remove every 'Requisites: ...' line from a description"""
+    pieces = []
+    position = 0
+    search_from = 0
+    length = len(text)
+
+    while True:
+        label = find_requisites_label(text, search_from)
+        if label is None:
+            break
+
+        start, end = label
+        value_start = skip_space(text, end)
+
+        if value_start == length:
+            # Trailing whitespace only: the line ends at the last non-newline character
+            value_start = value_start - 1
+            while value_start >= end and text[value_start] == '\n':
+                value_start -= 1
+            if value_start < end:
+                search_from = start + 1
+                continue
+
+        value_end = text.find('\n', value_start)
+        if value_end == -1:
+            value_end = length
+
+        pieces.append(text[position:start])
+        position = search_from = value_end
+
+    pieces.append(text[position:])
+    return "".join(pieces)
+
+def scan_course_text(course_text, hyphen_optional=True, credits_word_optional=True):
+    """Parse a course cell into code, title, credits, description and prerequisites"""
+    if not course_text or course_text.strip() == "":
+        return None
+
+    text = course_text.strip()
+    header = scan_header(text, hyphen_optional, credits_word_optional)
+    if header is None:
+        return None
+
+    code, title, number, description_start = header
+    description_text = text[description_start:]
+
+    return {
+        "code": code,
+        "title": title.strip(),
+        "credits": float(number),
+        "description": remove_requisites(description_text).strip(),
+        "prerequisites": scan_prerequisites(description_text)
+    }
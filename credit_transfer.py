@@ -0,0 +1,166 @@
+import csv
+import random
+import sys
+import time
+
+import numpy as np
+
+import course_catalogue
+from dedupe_courses import normalize_course_code
+
+# Students multiplied against the credit table at once, which bounds the
+# float copy of the completion matrix on huge exports
+BATCH_STUDENTS = 1 << 14
+
+def build_credit_table(catalogue):
+    """Encode the catalogue's placements as a course x (pathway, year, course type) credit table.
+
+    Returns (course index by code, columns, table) where columns lists
+    (pathway, year, course_type) and table[course, column] is the credits the
+    course earns there. Codes are normalized (DIGF2015 -> DIGF-2015), and a
+    course placed more than once in a pathway counts once, in its earliest year.
+    """
+    courses = catalogue["courses"]
+    pathways = list(catalogue["pathways"])
+    course_types = list(course_catalogue.COURSE_TYPE_LABELS)
+
+    first_placement = {}
+    for pathway_name, year, semester, course_type, course_id in catalogue["placements"]:
+        # Keyed like read_completions keys registrar codes, even for catalogues never deduped
+        code = normalize_course_code(courses[course_id]["code"])
+        if not code:
+            continue
+        rank = (year, course_types.index(course_type) if course_type in course_types else len(course_types))
+        key = (pathway_name, code)
+        if key not in first_placement or rank < first_placement[key][0]:
+            first_placement[key] = (rank, year, course_type, courses[course_id]["credits"])
+
+    course_index = {}
+    for _, code in first_placement:
+        course_index.setdefault(code, len(course_index))
+
+    years = sorted({year for _, year, _, _ in first_placement.values()})
+    present_types = {course_type for _, _, course_type, _ in first_placement.values()}
+    columns = [
+        (pathway_name, year, course_type)
+        for pathway_name in pathways
+        for year in years
+        for course_type in course_types + sorted(present_types - set(course_types))
+        if course_type in present_types
+    ]
+    column_index = {column: index for index, column in enumerate(columns)}
+
+    table = np.zeros((len(course_index), len(columns)), dtype=np.float64)
+    for (pathway_name, code), (_, year, course_type, credits) in first_placement.items():
+        table[course_index[code], column_index[(pathway_name, year, course_type)]] = credits
+
+    return course_index, columns, table
+
+def read_completions(csv_path):
+    """Read (student ids, current pathways, completions) from a registrar CSV export.
+
+    The export needs "student_id" and "course_code" columns, one row per
+    completed course; an optional "pathway" column names the student's
+    current pathway. Completions are returned as (student, code) pairs with
+    students numbered in order of first appearance.
+    """
+    student_ids = []
+    current_pathways = []
+    student_index = {}
+    completions = []
+
+    with open(csv_path, 'r', encoding='utf-8-sig', newline='') as file:
+        for row in csv.DictReader(file):
+            student_id = row["student_id"].strip()
+            index = student_index.get(student_id)
+            if index is None:
+                index = student_index[student_id] = len(student_ids)
+                student_ids.append(student_id)
+                current_pathways.append((row.get("pathway") or "").strip())
+            completions.append((index, normalize_course_code(row["course_code"])))
+
+    return student_ids, current_pathways, completions
+
+def calculate_transfer_credits(student_count, completions, course_index, table):
+    """Multiply every student's completed courses against the credit table.
+
+    Completions become a student x course boolean matrix, so repeated rows
+    for the same course count once, and the whole cohort's credits per
+    (pathway, year, course type) column come from one matrix product.
+    """
+    students = np.fromiter((student for student, _ in completions), dtype=np.int64, count=len(completions))
+    course_ids = np.fromiter((course_index.get(code, -1) for _, code in completions), dtype=np.int64,
+                             count=len(completions))
+
+    # Courses no pathway offers earn nothing toward any of them
+    known = course_ids >= 0
+    completed = np.zeros((student_count, len(course_index)), dtype=bool)
+    completed[students[known], course_ids[known]] = True
+
+    credits = np.empty((student_count, table.shape[1]), dtype=np.float64)
+    for start in range(0, student_count, BATCH_STUDENTS):
+        credits[start:start + BATCH_STUDENTS] = completed[start:start + BATCH_STUDENTS] @ table
+
+    return credits
+
+def write_transfer_csv(output_path, student_ids, current_pathways, columns, credits):
+    """Write one row per student and other pathway, with credits by year and course type"""
+    pathways = list(dict.fromkeys(pathway_name for pathway_name, _, _ in columns))
+    # Every pathway has the same (year, course type) slots, in the same order
+    slot_count = len(columns) // len(pathways) if pathways else 0
+    slots = [(year, course_type) for _, year, course_type in columns[:slot_count]]
+
+    with open(output_path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(["student_id", "pathway", "total_credits"] +
+                        [f"year_{year}_{course_type}" for year, course_type in slots])
+
+        for student, student_id in enumerate(student_ids):
+            for pathway_position, pathway_name in enumerate(pathways):
+                if pathway_name == current_pathways[student]:
+                    continue
+                row = credits[student, pathway_position * slot_count:(pathway_position + 1) * slot_count]
+                writer.writerow([student_id, pathway_name, f"{row.sum():g}"] + [f"{value:g}" for value in row])
+
+def benchmark(student_count=20000, courses_per_student=30, catalogue_dir="pathways", seed=0):
+    """Time the calculation for a synthetic cohort drawn from a catalogue's course codes"""
+    rng = random.Random(seed)
+    catalogue = course_catalogue.load_catalogue(catalogue_dir)
+    course_index, columns, table = build_credit_table(catalogue)
+    codes = list(course_index) + ["ELEC-9999"]
+
+    completions = [
+        (student, code)
+        for student in range(student_count)
+        for code in rng.sample(codes, min(len(codes), courses_per_student))
+    ]
+
+    start = time.perf_counter()
+    calculate_transfer_credits(student_count, completions, course_index, table)
+    return len(completions), time.perf_counter() - start
+
+def main():
+    """Calculate transfer credits for a registrar CSV export against a catalogue directory"""
+    if len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+        rows, seconds = benchmark()
+        print(f"Evaluated {rows} completions in {seconds:.3f}s")
+        return
+
+    if len(sys.argv) not in (2, 3, 4):
+        print("Usage: python credit_transfer.py REGISTRAR.csv [CATALOGUE_DIR] [OUTPUT.csv]")
+        sys.exit(1)
+
+    catalogue_dir = sys.argv[2] if len(sys.argv) > 2 else "pathways"
+    output_path = sys.argv[3] if len(sys.argv) > 3 else "credit-transfer.csv"
+
+    catalogue = course_catalogue.load_catalogue(catalogue_dir)
+    course_index, columns, table = build_credit_table(catalogue)
+
+    student_ids, current_pathways, completions = read_completions(sys.argv[1])
+    credits = calculate_transfer_credits(len(student_ids), completions, course_index, table)
+    write_transfer_csv(output_path, student_ids, current_pathways, columns, credits)
+
+    print(f"Calculated transfer credits for {len(student_ids)} students, saved {output_path}")
+
+if __name__ == "__main__":
+    main()
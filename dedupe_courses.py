@@ -0,0 +1,258 @@
+import json
+import random
+import re
+import sys
+import zlib
+
+import course_catalogue
+
+# MinHash / LSH settings: 16 bands of 4 rows puts the candidate threshold near 0.5 Jaccard
+NUM_PERMUTATIONS = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+SHINGLE_SIZE = 3
+SIMILARITY_THRESHOLD = 0.6
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+# Fixed seed so signatures are stable between builds
+_rng = random.Random(2025)
+PERMUTATIONS = [
+    (_rng.randrange(1, MERSENNE_PRIME), _rng.randrange(0, MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+def normalize_course_code(code):
+    """Normalize a course code to the hyphenated form, e.g. DIGF1003 -> DIGF-1003"""
+    if not code:
+        return code
+    code_match = re.match(r'^([A-Za-z]{4})\s*-?\s*(\d{4})$', code.strip())
+    if code_match:
+        return f"{code_match.group(1).upper()}-{code_match.group(2)}"
+    return code.strip()
+
+def shingle_text(text):
+    """Hash the word shingles of a course's text into a set of 32-bit integers"""
+    words = re.findall(r'\w+', text.lower())
+    if len(words) < SHINGLE_SIZE:
+        return {zlib.crc32(" ".join(words).encode('utf-8'))} if words else set()
+
+    return {
+        zlib.crc32(" ".join(words[i:i + SHINGLE_SIZE]).encode('utf-8'))
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+
+def minhash_signature(shingles):
+    """Compute the MinHash signature of a shingle set"""
+    return tuple(
+        min(((a * shingle + b) % MERSENNE_PRIME) & MAX_HASH for shingle in shingles)
+        for a, b in PERMUTATIONS
+    )
+
+def estimate_similarity(signature_a, signature_b):
+    """Estimate Jaccard similarity from two MinHash signatures"""
+    matches = sum(1 for a, b in zip(signature_a, signature_b) if a == b)
+    return matches / NUM_PERMUTATIONS
+
+def find_near_duplicates(records):
+    """Group records with identical signatures and pair up near-identical groups.
+
+    Returns (groups, pairs): groups lists the record indices sharing one
+    MinHash signature, and pairs holds (group i, group j, similarity) for
+    groups whose text is near-identical. Identical signatures collapse into
+    one representative before bucketing, so boilerplate shared by thousands
+    of records is compared once, and candidate pairs come from LSH buckets
+    over band slices, so only groups that collide in a band are compared.
+    """
+    group_index = {}
+    groups = []
+    signatures = []
+    buckets = {}
+
+    for index, record in enumerate(records):
+        shingles = shingle_text(f"{record['title']} {record['description']}")
+        if not shingles:
+            continue
+
+        signature = minhash_signature(shingles)
+        if signature in group_index:
+            groups[group_index[signature]].append(index)
+            continue
+
+        group_index[signature] = len(groups)
+        groups.append([index])
+        signatures.append(signature)
+
+        for band in range(BANDS):
+            band_key = (band, signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND])
+            if band_key not in buckets:
+                buckets[band_key] = []
+            buckets[band_key].append(group_index[signature])
+
+    seen = set()
+    pairs = []
+
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        for position, i in enumerate(members):
+            for j in members[position + 1:]:
+                if (i, j) in seen:
+                    continue
+                seen.add((i, j))
+
+                similarity = estimate_similarity(signatures[i], signatures[j])
+                if similarity >= SIMILARITY_THRESHOLD:
+                    pairs.append((i, j, similarity))
+
+    return groups, pairs
+
+def dedupe_catalogue(catalogue):
+    """Normalize course codes and merge near-duplicate course records in place.
+
+    Records that share a normalized code and have near-identical text are
+    rewritten to a single canonical title and description. Near-duplicates
+    with different codes are only flagged, one entry per group of linked
+    records, since they may be cross-listings.
+    """
+    courses = catalogue["courses"]
+    placement_counts = [0] * len(courses)
+    for pathway_name, year, semester, course_type, course_id in catalogue["placements"]:
+        placement_counts[course_id] += 1
+
+    records = []
+    record_index = {}
+    record_courses = []
+
+    # Collect distinct records, keeping the course table entries that use them
+    for course_id, course in enumerate(courses):
+        if course.get("code"):
+            course["code"] = normalize_course_code(course["code"])
+
+        key = (course.get("code", ""), course["title"], course.get("description", ""))
+        if key not in record_index:
+            record_index[key] = len(records)
+            records.append({
+                "code": key[0],
+                "title": key[1],
+                "description": key[2]
+            })
+            record_courses.append([])
+        record_courses[record_index[key]].append(course_id)
+
+    # Union-find over near-duplicate records: merge_parent links records that
+    # share a code, flag_parent links every near-duplicate for cross-listings
+    merge_parent = list(range(len(records)))
+    flag_parent = list(range(len(records)))
+
+    def find(parent, i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(parent, i, j):
+        parent[find(parent, i)] = find(parent, j)
+
+    groups, pairs = find_near_duplicates(records)
+
+    # Records with identical signatures are near-duplicates of each other
+    group_codes = []
+    for members in groups:
+        first_by_code = {}
+        for index in members:
+            code = records[index]["code"]
+            if code in first_by_code:
+                union(merge_parent, index, first_by_code[code])
+            else:
+                first_by_code[code] = index
+            union(flag_parent, index, members[0])
+        group_codes.append(first_by_code)
+
+    for i, j, similarity in pairs:
+        smaller, larger = sorted((group_codes[i], group_codes[j]), key=len)
+        for code, index in smaller.items():
+            if code in larger:
+                union(merge_parent, index, larger[code])
+        union(flag_parent, groups[i][0], groups[j][0])
+
+    report = {
+        "merged": [],
+        "flagged": []
+    }
+
+    # Each group of near-duplicates spanning several codes is reported once,
+    # with the weakest similarity that links it
+    similarity_by_root = {}
+    for i, j, similarity in pairs:
+        root = find(flag_parent, groups[i][0])
+        similarity_by_root[root] = min(similarity_by_root.get(root, 1.0), similarity)
+
+    flag_groups = {}
+    for index in range(len(records)):
+        root = find(flag_parent, index)
+        if root not in flag_groups:
+            flag_groups[root] = []
+        flag_groups[root].append(index)
+
+    for root, members in flag_groups.items():
+        codes = sorted({records[index]["code"] for index in members})
+        if len(codes) < 2:
+            continue
+        report["flagged"].append({
+            "codes": codes,
+            "titles": sorted({records[index]["title"] for index in members}),
+            "similarity": similarity_by_root.get(root, 1.0)
+        })
+
+    report["flagged"].sort(key=lambda entry: entry["codes"])
+
+    clusters = {}
+    for index in range(len(records)):
+        root = find(merge_parent, index)
+        if root not in clusters:
+            clusters[root] = []
+        clusters[root].append(index)
+
+    for members in clusters.values():
+        if len(members) < 2:
+            continue
+
+        # The variant used by the most placements wins, then the longest description
+        canonical = max(
+            members,
+            key=lambda index: (
+                sum(placement_counts[course_id] for course_id in record_courses[index]),
+                len(records[index]["description"])
+            )
+        )
+
+        for index in members:
+            for course_id in record_courses[index]:
+                courses[course_id]["title"] = records[canonical]["title"]
+                courses[course_id]["description"] = records[canonical]["description"]
+
+        report["merged"].append({
+            "code": records[canonical]["code"],
+            "title": records[canonical]["title"],
+            "variants": sorted({records[index]["title"] for index in members})
+        })
+
+    # Records rewritten to the same text now share one course table entry
+    course_catalogue.reindex_courses(catalogue)
+
+    return report
+
+def main():
+    """Report near-duplicate courses in a catalogue directory"""
+    catalogue_dir = sys.argv[1] if len(sys.argv) > 1 else "pathways"
+
+    catalogue = course_catalogue.load_catalogue(catalogue_dir)
+    report = dedupe_catalogue(catalogue)
+
+    json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+    print()
+
+if __name__ == "__main__":
+    main()
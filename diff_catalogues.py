@@ -0,0 +1,165 @@
+import json
+import sys
+
+import course_catalogue
+from dedupe_courses import normalize_course_code
+
+COURSE_FIELDS = ("title", "credits", "description", "prerequisites")
+
+def flatten_catalogue(catalogue):
+    """Flatten a catalogue into per-pathway course variants and placement sets in one pass.
+
+    Codes are normalized (DIGF2015 -> DIGF-2015), and every distinct record
+    of a code is kept per pathway, in document order, so text that differs
+    between pathways is compared too.
+    """
+    courses = {}
+    placements = {}
+
+    for pathway_name, year, semester, course_type, course_id in course_catalogue.iter_placements(catalogue):
+        course = catalogue["courses"][course_id]
+        code = normalize_course_code(course.get("code")) or course.get("title", "")
+
+        variants = courses.setdefault(code, {}).setdefault(pathway_name, {})
+        variants[tuple(course.get(field) for field in COURSE_FIELDS)] = None
+
+        key = (pathway_name, code)
+        if key not in placements:
+            placements[key] = set()
+        placements[key].add((year, semester, course_type))
+
+    return courses, placements
+
+def first_title(pathway_variants):
+    """Return the title of a code's first variant in any pathway"""
+    for variants in pathway_variants.values():
+        for fields in variants:
+            return fields[0]
+
+def field_values(variants, position):
+    """Return a field's distinct values across variants: the value itself when there is only one"""
+    values = list(dict.fromkeys(fields[position] for fields in variants))
+    return values[0] if len(values) == 1 else values
+
+def placement_to_json(placement):
+    """Convert a (year, semester, course_type) tuple to a JSON object"""
+    year, semester, course_type = placement
+    return {"year": year, "semester": semester, "course_type": course_type}
+
+def sort_placements(placements):
+    """Sort placements with missing semesters ordered first"""
+    return sorted(placements, key=lambda p: (p[0], p[1] or "", p[2]))
+
+def diff_catalogues(old_catalogue, new_catalogue):
+    """Compare two catalogue builds and report course and placement changes"""
+    old_courses, old_placements = flatten_catalogue(old_catalogue)
+    new_courses, new_placements = flatten_catalogue(new_catalogue)
+
+    diff_data = {
+        "summary": {},
+        "courses": {
+            "added": [],
+            "removed": [],
+            "changed": []
+        },
+        "placements": {
+            "added": [],
+            "removed": [],
+            "moved": []
+        }
+    }
+
+    # Course table changes, compared per pathway across every variant
+    for code, new_pathways in new_courses.items():
+        old_pathways = old_courses.get(code)
+        if old_pathways is None:
+            diff_data["courses"]["added"].append({"code": code, "title": first_title(new_pathways)})
+            continue
+
+        for pathway_name, new_variants in new_pathways.items():
+            old_variants = old_pathways.get(pathway_name)
+            if old_variants is None or old_variants.keys() == new_variants.keys():
+                continue
+
+            changes = {}
+            for position, field in enumerate(COURSE_FIELDS):
+                old_value = field_values(old_variants, position)
+                new_value = field_values(new_variants, position)
+                if old_value != new_value:
+                    changes[field] = {"old": old_value, "new": new_value}
+            diff_data["courses"]["changed"].append({"pathway": pathway_name, "code": code, "changes": changes})
+
+    for code, old_pathways in old_courses.items():
+        if code not in new_courses:
+            diff_data["courses"]["removed"].append({"code": code, "title": first_title(old_pathways)})
+
+    # Per-pathway placement changes; a course that only gains (or only
+    # loses) cells within a pathway is an addition (or removal), not a move
+    for key, new_set in new_placements.items():
+        pathway_name, code = key
+        old_set = old_placements.get(key, set())
+        added = new_set - old_set
+        removed = old_set - new_set
+
+        if added and removed:
+            diff_data["placements"]["moved"].append({
+                "pathway": pathway_name,
+                "code": code,
+                "from": [placement_to_json(p) for p in sort_placements(removed)],
+                "to": [placement_to_json(p) for p in sort_placements(added)]
+            })
+        elif added:
+            diff_data["placements"]["added"].append({
+                "pathway": pathway_name,
+                "code": code,
+                "to": [placement_to_json(p) for p in sort_placements(added)]
+            })
+        elif removed:
+            diff_data["placements"]["removed"].append({
+                "pathway": pathway_name,
+                "code": code,
+                "from": [placement_to_json(p) for p in sort_placements(removed)]
+            })
+
+    for key, old_set in old_placements.items():
+        if key not in new_placements:
+            pathway_name, code = key
+            diff_data["placements"]["removed"].append({
+                "pathway": pathway_name,
+                "code": code,
+                "from": [placement_to_json(p) for p in sort_placements(old_set)]
+            })
+
+    # Keep output stable between runs
+    for section in ("courses", "placements"):
+        for entries in diff_data[section].values():
+            entries.sort(key=lambda entry: (entry.get("pathway", ""), entry["code"]))
+
+    diff_data["summary"] = {
+        f"{section}_{change}": len(entries)
+        for section in ("courses", "placements")
+        for change, entries in diff_data[section].items()
+    }
+
+    return diff_data
+
+def main():
+    """Diff two catalogue directories and print the result as JSON"""
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python diff_catalogues.py OLD_DIR NEW_DIR [OUTPUT.json]")
+        sys.exit(1)
+
+    old_catalogue = course_catalogue.load_catalogue(sys.argv[1])
+    new_catalogue = course_catalogue.load_catalogue(sys.argv[2])
+    diff_data = diff_catalogues(old_catalogue, new_catalogue)
+
+    if len(sys.argv) == 4:
+        with open(sys.argv[3], 'w', encoding='utf-8') as f:
+            json.dump(diff_data, f, indent=2, ensure_ascii=False)
+        print(f"Saved {sys.argv[3]}")
+    else:
+        json.dump(diff_data, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+import asyncio
+import csv
+import email.utils
+import hashlib
+import http.client
+import io
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import quote, unquote, urlsplit
+
+import course_scanner
+import pathway_csv
+
+# Pulls pathway sheets from an HTTP CSV-export endpoint instead of the manual
+# baseFiles exports. The endpoint is a URL template with a {pathway}
+# placeholder, e.g.
+#
+#   https://sheets.example.edu/export?sheet={pathway}&format=csv
+#
+# Validators (ETag / Last-Modified) and the parsed pathway are cached per
+# sheet, so a 304 (or an identical body) skips both the download and the parse.
+
+CACHE_DIR = ".sheet-cache"
+
+MAX_CONNECTIONS = 4
+REQUEST_TIMEOUT = 30
+
+def parser_fingerprint():
+    """Hash the parser's source and this module's, so editing either invalidates every cache entry"""
+    digest = hashlib.sha256()
+    # This module defines the cache entry format, so it is hashed along with the parser
+    for path in (pathway_csv.__file__, course_scanner.__file__, __file__):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+# Cache entries are only reused by the exact parser and entry format that wrote them
+PARSER_FINGERPRINT = parser_fingerprint()
+
+class ConnectionPool:
+    """Keep-alive HTTP connections per host, shared by the download threads"""
+
+    def __init__(self, timeout=REQUEST_TIMEOUT):
+        self.timeout = timeout
+        self.idle = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, scheme, netloc):
+        with self.lock:
+            connections = self.idle.get((scheme, netloc))
+            if connections:
+                return connections.pop(), True
+
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return connection_class(netloc, timeout=self.timeout), False
+
+    def release(self, scheme, netloc, connection):
+        with self.lock:
+            self.idle.setdefault((scheme, netloc), []).append(connection)
+
+    def get(self, url, headers):
+        """GET url and return (status, headers, body), reusing an idle connection when possible"""
+        parts = urlsplit(url)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        while True:
+            connection, reused = self.acquire(parts.scheme, parts.netloc)
+            try:
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                if reused:
+                    # The server dropped an idle keep-alive connection; retry on a fresh one
+                    continue
+                raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                self.release(parts.scheme, parts.netloc, connection)
+            return response.status, response.headers, body
+
+    def close(self):
+        with self.lock:
+            for connections in self.idle.values():
+                for connection in connections:
+                    connection.close()
+            self.idle.clear()
+
+def sheet_url(url_template, pathway_name):
+    """Fill the {pathway} placeholder of an export URL template"""
+    return url_template.replace("{pathway}", quote(pathway_name))
+
+def load_cache_entry(cache_dir, pathway_name, url):
+    """Return the cached validators and parse for a sheet fetched from url, or None"""
+    try:
+        with open(os.path.join(cache_dir, f"{pathway_name}.json"), 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    # Another endpoint's validators could earn a 304 for a parse it never served
+    if entry.get("parser") != PARSER_FINGERPRINT or entry.get("url") != url:
+        return None
+    return entry
+
+def save_cache_entry(cache_dir, pathway_name, entry):
+    """Write a sheet's validators and parse to the cache directory"""
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    with open(os.path.join(cache_dir, f"{pathway_name}.json"), 'w', encoding='utf-8') as f:
+        json.dump(entry, f, ensure_ascii=False)
+
+def conditional_headers(entry):
+    """Build If-None-Match / If-Modified-Since headers from a cache entry"""
+    headers = {}
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+def decode_sheet(headers, body):
+    """Decode a CSV export using its declared charset, else latin-1 like the file-based parser"""
+    return body.decode(headers.get_content_charset() or 'latin-1')
+
+async def fetch_pathway_sheets(url_template, pathway_names, cache_dir=CACHE_DIR, max_connections=MAX_CONNECTIONS):
+    """Download and parse every pathway sheet concurrently.
+
+    Downloads run on a thread pool over pooled keep-alive connections. Each
+    sheet is parsed as soon as its download completes, while the others are
+    still in flight. Returns (pathways_data in pathway_names order, report)
+    where report lists which sheets were "downloaded" and "unchanged", and
+    the "unparsed" course cells of every sheet, cached ones included.
+    """
+    loop = asyncio.get_running_loop()
+    pool = ConnectionPool()
+    entries = {
+        pathway_name: load_cache_entry(cache_dir, pathway_name, sheet_url(url_template, pathway_name))
+        for pathway_name in pathway_names
+    }
+
+    pathways_data = {}
+    report = {"downloaded": [], "unchanged": [], "unparsed": []}
+
+    async def download(executor, pathway_name):
+        url = sheet_url(url_template, pathway_name)
+        status, headers, body = await loop.run_in_executor(
+            executor, pool.get, url, conditional_headers(entries[pathway_name])
+        )
+        return pathway_name, url, status, headers, body
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_connections) as executor:
+            downloads = [download(executor, pathway_name) for pathway_name in pathway_names]
+
+            for next_download in asyncio.as_completed(downloads):
+                pathway_name, url, status, headers, body = await next_download
+                entry = entries[pathway_name]
+
+                if status == 304 and entry:
+                    pathways_data[pathway_name] = entry["pathway"]
+                    report["unchanged"].append(pathway_name)
+                    report["unparsed"].extend(entry["unparsed"])
+                    continue
+
+                if status != 200:
+                    raise RuntimeError(f"{url}: HTTP {status}")
+
+                # Servers without validators still resend identical sheets
+                digest = hashlib.sha256(body).hexdigest()
+                if entry and entry.get("sha256") == digest:
+                    pathway_data = entry["pathway"]
+                    unparsed = entry["unparsed"]
+                    report["unchanged"].append(pathway_name)
+                else:
+                    rows = list(csv.reader(io.StringIO(decode_sheet(headers, body), newline='')))
+                    unparsed = []
+                    pathway_data = pathway_csv.parse_csv_rows(rows, pathway_name, unparsed)
+                    report["downloaded"].append(pathway_name)
+
+                pathways_data[pathway_name] = pathway_data
+                report["unparsed"].extend(unparsed)
+                save_cache_entry(cache_dir, pathway_name, {
+                    "parser": PARSER_FINGERPRINT,
+                    "url": url,
+                    "etag": headers.get("ETag"),
+                    "last_modified": headers.get("Last-Modified"),
+                    "sha256": digest,
+                    "pathway": pathway_data,
+                    "unparsed": unparsed
+                })
+    finally:
+        pool.close()
+
+    return {pathway_name: pathways_data[pathway_name] for pathway_name in pathway_names}, report
+
+class SheetRequestHandler(BaseHTTPRequestHandler):
+    """Serve local CSV files as a stand-in export endpoint, honouring ETag and If-Modified-Since"""
+
+    protocol_version = "HTTP/1.1"
+    sheets = {}
+
+    def do_GET(self):
+        sheet_path = self.sheets.get(unquote(urlsplit(self.path).path).lstrip('/'))
+        if sheet_path is None:
+            self.send_error(404)
+            return
+
+        with open(sheet_path, 'rb') as f:
+            body = f.read()
+
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        modified = int(os.path.getmtime(sheet_path))
+        last_modified = email.utils.formatdate(modified, usegmt=True)
+
+        if_none_match = self.headers.get("If-None-Match")
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_none_match is not None:
+            not_modified = etag in (tag.strip() for tag in if_none_match.split(','))
+        elif if_modified_since is not None:
+            since = email.utils.parsedate_to_datetime(if_modified_since)
+            not_modified = since is not None and modified <= since.timestamp()
+        else:
+            not_modified = False
+
+        self.send_response(304 if not_modified else 200)
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", last_modified)
+        if not_modified:
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_header("Content-Type", "text/csv")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def serve_sheets(sheets, port=8000):
+    """Start a stand-in export server for {"<pathway>.csv": file path}; returns the server"""
+    handler = type("BoundSheetRequestHandler", (SheetRequestHandler,), {"sheets": dict(sheets)})
+    return ThreadingHTTPServer(("127.0.0.1", port), handler)
+
+def main():
+    """Fetch every pathway sheet from URL_TEMPLATE, or serve baseFiles with --serve [PORT]"""
+    if len(sys.argv) > 1 and sys.argv[1] == "--serve":
+        port = int(sys.argv[2]) if len(sys.argv) > 2 else 8000
+        server = serve_sheets({
+            f"{pathway_name}.csv": csv_path
+            for pathway_name, csv_path in pathway_csv.CSV_FILES.items()
+        }, port)
+        print(f"Serving pathway sheets at http://127.0.0.1:{port}/{{pathway}}.csv")
+        server.serve_forever()
+        return
+
+    if len(sys.argv) != 2:
+        print("Usage: python fetch_sheets.py URL_TEMPLATE | --serve [PORT]")
+        sys.exit(1)
+
+    pathways_data, report = asyncio.run(
+        fetch_pathway_sheets(sys.argv[1], list(pathway_csv.CSV_FILES))
+    )
+    print(f"Downloaded {len(report['downloaded'])} sheets, {len(report['unchanged'])} unchanged")
+
+if __name__ == "__main__":
+    main()
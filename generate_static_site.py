@@ -0,0 +1,294 @@
+import hashlib
+import html
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from string import Template
+
+import course_catalogue
+
+# Templates are compiled once per process at import time
+PAGE_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$title - Digital Futures Pathways</title>
+    <link rel="stylesheet" href="${root}styles.css">
+</head>
+<body>
+    <div class="container">
+        <aside class="sidebar">
+            <div class="sidebar-header">
+                <h2><a href="${root}index.html">Digital Futures</a></h2>
+            </div>
+            <nav class="pathway-cards">
+$navigation
+            </nav>
+        </aside>
+
+        <main class="main-content">
+            <div class="content-header">
+                <h1>$title</h1>
+                <p class="pathway-info">$subtitle</p>
+            </div>
+            <div class="course-grid-container">
+$content
+            </div>
+        </main>
+    </div>
+</body>
+</html>
+""")
+
+NAVIGATION_TEMPLATE = Template("""                <a class="pathway-card$active" href="${root}pages/$pathway.html">
+                    <h3>$name</h3>
+                </a>""")
+
+COURSE_ITEM_TEMPLATE = Template("""                        <a class="course-item $credit_class" href="courses/$code.html">
+                            <div class="course-title">$title</div>
+                            <div class="course-code">$code</div>
+                            <div class="course-credits">$credits Credits</div>
+                        </a>""")
+
+COURSE_DETAILS_TEMPLATE = Template("""                <div class="course-meta">
+                    <span class="course-code">$code</span>
+                    <span class="course-credits">$credits Credits</span>
+                </div>
+                <div class="course-description">$description</div>
+                <h3>Prerequisites</h3>
+                <p>$prerequisites</p>
+                <h3>Offered in</h3>
+                <ul>
+$offered_in
+                </ul>""")
+
+OFFERED_IN_TEMPLATE = Template("""                    <li><a href="../$pathway.html">$name</a>: $placements</li>""")
+
+def renderer_fingerprint():
+    """Hash this module's source, so editing a template or a renderer invalidates every page"""
+    with open(__file__, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+# Pages in the manifest are only reused by the exact renderer that wrote them
+RENDERER_FINGERPRINT = renderer_fingerprint()
+
+MANIFEST_NAME = "manifest.json"
+
+def escape(value):
+    """Escape a value for HTML, rendering None as an empty string"""
+    return html.escape("" if value is None else str(value))
+
+def format_credits(credits):
+    """Format credits as the site script prints numbers, e.g. 1.0 as 1 and 0.5 as 0.5"""
+    return "" if credits is None else f"{credits:g}"
+
+def render_navigation(pathways, current, root):
+    """Render the sidebar links to every pathway page"""
+    return "\n".join(
+        NAVIGATION_TEMPLATE.substitute(
+            active=" active" if pathway == current else "",
+            root=root,
+            pathway=escape(pathway),
+            name=escape(name)
+        )
+        for pathway, name in pathways
+    )
+
+def render_pathway_page(context):
+    """Render the year/semester grid page for one pathway"""
+    view = context["view"]
+    courses = context["courses"]
+
+    grid = ['                <div class="grid-with-headers">',
+            '                    <div class="grid-header corner-cell"></div>']
+    for column in view["columns"]:
+        grid.append(f'                    <div class="grid-header course-type-label">{escape(column["label"])}</div>')
+
+    for row in view["rows"]:
+        grid.append(f'                    <div class="grid-header year-label">{escape(row["label"])}</div>')
+        for cell in row["cells"]:
+            if not cell["course_count"]:
+                grid.append('                    <div class="grid-cell empty"></div>')
+                continue
+            grid.append('                    <div class="grid-cell">')
+            grid.append(f'                        <div class="cell-badge">{cell["course_count"]} '
+                        f'{"course" if cell["course_count"] == 1 else "courses"} · {format_credits(cell["total_credits"])} Credits</div>')
+            for course_id in cell["course_ids"]:
+                course = courses[str(course_id)]
+                grid.append(COURSE_ITEM_TEMPLATE.substitute(
+                    credit_class="course-item-full" if course["credits"] == 1.0 else "course-item-half",
+                    code=escape(course["code"]),
+                    title=escape(course["title"]),
+                    credits=escape(format_credits(course["credits"]))
+                ))
+            grid.append('                    </div>')
+    grid.append('                </div>')
+
+    return PAGE_TEMPLATE.substitute(
+        title=escape(view["name"]),
+        subtitle=f"Viewing {escape(view['name'])} pathway",
+        root="../",
+        navigation=render_navigation(context["pathways"], view["pathway"], "../"),
+        content="\n".join(grid)
+    )
+
+def render_course_page(context):
+    """Render the detail page for one course"""
+    course = context["course"]
+    names = dict(context["pathways"])
+
+    offered_in = "\n".join(
+        OFFERED_IN_TEMPLATE.substitute(
+            pathway=escape(pathway),
+            name=escape(names.get(pathway, pathway)),
+            placements=escape(", ".join(placements))
+        )
+        for pathway, placements in context["offered_in"]
+    )
+
+    return PAGE_TEMPLATE.substitute(
+        title=escape(course["title"]),
+        subtitle=escape(course["code"]),
+        root="../../",
+        navigation=render_navigation(context["pathways"], None, "../../"),
+        content=COURSE_DETAILS_TEMPLATE.substitute(
+            code=escape(course["code"]),
+            credits=escape(format_credits(course["credits"])),
+            description=escape(course["description"] or "No description available."),
+            prerequisites=escape(course.get("prerequisites") or "None"),
+            offered_in=offered_in
+        )
+    )
+
+RENDERERS = {
+    "pathway": render_pathway_page,
+    "course": render_course_page
+}
+
+def render_and_write(task):
+    """Render one page and write it to disk (runs in a worker process)"""
+    output_path, kind, context = task
+    page = RENDERERS[kind](context)
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(page)
+
+    return output_path
+
+def fingerprint(kind, context):
+    """Hash everything a page depends on, so unchanged pages can be skipped"""
+    payload = json.dumps([RENDERER_FINGERPRINT, kind, context], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def build_page_tasks(catalogue, comparison_data, output_dir):
+    """Build (output path, kind, context) for every pathway and course page"""
+    courses = catalogue["courses"]
+    pathways = [
+        (pathway_name, pathway["meta"].get("name", pathway_name))
+        for pathway_name, pathway in catalogue["pathways"].items()
+    ]
+
+    tasks = []
+
+    for pathway_name in catalogue["pathways"]:
+        view = course_catalogue.create_view_model_json(catalogue, pathway_name)
+        used_ids = {course_id for row in view["rows"] for cell in row["cells"] for course_id in cell["course_ids"]}
+        tasks.append((
+            os.path.join(output_dir, f"{pathway_name}.html"),
+            "pathway",
+            {
+                "pathways": pathways,
+                "view": view,
+                # Only the courses this page shows, keyed as JSON would key them
+                "courses": {str(course_id): courses[course_id] for course_id in sorted(used_ids)}
+            }
+        ))
+
+    # "Offered in" comes from the comparison; placements add where each pathway puts it
+    offered_in = {}
+    for course_type, type_courses in comparison_data["comparison"]["by_course_type"].items():
+        for course_key, entry in type_courses.items():
+            code = entry["details"]["code"]
+            for pathway_name in entry["offered_in"]:
+                offered_in.setdefault(code, {}).setdefault(pathway_name, [])
+
+    for pathway_name, year, semester, course_type, course_id in catalogue["placements"]:
+        code = courses[course_id]["code"]
+        label = course_catalogue.COURSE_TYPE_LABELS.get(course_type, course_type)
+        when = f"Year {year} {semester.title()}" if semester else f"Year {year}"
+        offered_in.setdefault(code, {}).setdefault(pathway_name, []).append(f"{when} ({label})")
+
+    written_codes = set()
+    for course in courses:
+        # One page per code; later variants of the same code share it
+        if not course["code"] or course["code"] in written_codes:
+            continue
+        written_codes.add(course["code"])
+
+        tasks.append((
+            os.path.join(output_dir, "courses", f"{course['code']}.html"),
+            "course",
+            {
+                "pathways": pathways,
+                "course": course,
+                "offered_in": sorted(offered_in.get(course["code"], {}).items())
+            }
+        ))
+
+    return tasks
+
+def generate_site(catalogue, comparison_data, output_dir="pages", workers=None):
+    """Render every pathway and course page in parallel, skipping unchanged ones"""
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        manifest = {}
+
+    new_manifest = {}
+    pending = []
+
+    for task in build_page_tasks(catalogue, comparison_data, output_dir):
+        output_path, kind, context = task
+        page_name = os.path.relpath(output_path, output_dir)
+        new_manifest[page_name] = fingerprint(kind, context)
+
+        if manifest.get(page_name) != new_manifest[page_name] or not os.path.exists(output_path):
+            pending.append(task)
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(render_and_write, pending, chunksize=max(1, len(pending) // 32)))
+
+    # Remove pages that no longer exist in the catalogue
+    for page_name in manifest.keys() - new_manifest.keys():
+        stale_path = os.path.join(output_dir, page_name)
+        if os.path.exists(stale_path):
+            os.remove(stale_path)
+
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(new_manifest, f, indent=2, sort_keys=True)
+
+    return len(pending), len(new_manifest) - len(pending)
+
+def main():
+    """Generate static pages from the pathway JSON in a catalogue directory"""
+    catalogue_dir = sys.argv[1] if len(sys.argv) > 1 else "pathways"
+
+    with open(os.path.join(catalogue_dir, "pathway-comparison.json"), 'r', encoding='utf-8') as f:
+        comparison_data = json.load(f)
+
+    # Keep the converter's pathway order so unchanged pages stay unchanged
+    catalogue = course_catalogue.load_catalogue(catalogue_dir, comparison_data["pathways"])
+
+    rendered, skipped = generate_site(catalogue, comparison_data, os.path.join(catalogue_dir, "pages"))
+    print(f"Rendered {rendered} pages, skipped {skipped} unchanged")
+
+if __name__ == "__main__":
+    main()
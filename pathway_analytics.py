@@ -0,0 +1,126 @@
+import json
+import sys
+
+import course_catalogue
+
+def iter_bits(mask):
+    """Yield the index of every set bit in mask, lowest first"""
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+def build_course_bitsets(catalogue):
+    """Assign every course code a bit and build per-pathway bitsets.
+
+    Returns (codes, credit_masks, bitsets) where credit_masks maps a credit
+    value to the bits of courses worth that much, and bitsets maps
+    (group, key) -> {pathway: mask} for the "overall", "year" and
+    "course_type" breakdowns.
+    """
+    courses = catalogue["courses"]
+    bit_by_code = {}
+    codes = []
+    credit_masks = {}
+    bitsets = {}
+
+    for pathway_name, year, semester, course_type, course_id in catalogue["placements"]:
+        course = courses[course_id]
+        code = course["code"] or course["title"]
+
+        bit = bit_by_code.get(code)
+        if bit is None:
+            bit = bit_by_code[code] = len(codes)
+            codes.append(code)
+            credit_masks[course["credits"]] = credit_masks.get(course["credits"], 0) | (1 << bit)
+
+        for group_key in (("overall", None), ("year", year), ("course_type", course_type)):
+            masks = bitsets.setdefault(group_key, {})
+            masks[pathway_name] = masks.get(pathway_name, 0) | (1 << bit)
+
+    return codes, credit_masks, bitsets
+
+def mask_credits(mask, credit_masks):
+    """Total credits of the courses in mask, one popcount per distinct credit value"""
+    return sum(credits * (mask & credit_mask).bit_count() for credits, credit_mask in credit_masks.items())
+
+def compare_masks(pathways, masks, codes, credit_masks):
+    """Build the overlap matrix and unique courses for one breakdown"""
+    pathway_masks = [masks.get(pathway_name, 0) for pathway_name in pathways]
+
+    # Union of every other pathway via prefix and suffix ORs, linear in the pathway count
+    prefix = [0]
+    for mask in pathway_masks:
+        prefix.append(prefix[-1] | mask)
+    suffix = [0]
+    for mask in reversed(pathway_masks):
+        suffix.append(suffix[-1] | mask)
+    suffix.reverse()
+
+    matrix = {}
+    unique = {}
+
+    for i, pathway_a in enumerate(pathways):
+        mask_a = pathway_masks[i]
+        matrix[pathway_a] = {}
+
+        for j, pathway_b in enumerate(pathways):
+            if i == j:
+                continue
+            mask_b = pathway_masks[j]
+            shared = mask_a & mask_b
+            union = mask_a | mask_b
+            matrix[pathway_a][pathway_b] = {
+                "shared_courses": shared.bit_count(),
+                "shared_credits": mask_credits(shared, credit_masks),
+                "jaccard": round(shared.bit_count() / union.bit_count(), 4) if union else 0.0
+            }
+
+        unique_mask = mask_a & ~(prefix[i] | suffix[i + 1])
+        unique[pathway_a] = {
+            "courses": sorted(codes[bit] for bit in iter_bits(unique_mask)),
+            "credits": mask_credits(unique_mask, credit_masks)
+        }
+
+    return {
+        "matrix": matrix,
+        "unique": unique
+    }
+
+def create_overlap_analytics(catalogue):
+    """Create pairwise overlap analytics across pathways, overall and by year and course type"""
+    pathways = list(catalogue["pathways"].keys())
+    codes, credit_masks, bitsets = build_course_bitsets(catalogue)
+
+    analytics_data = {
+        "program": catalogue["program"],
+        "academic_year": catalogue["academic_year"],
+        "pathways": pathways,
+        "overall": compare_masks(pathways, bitsets.get(("overall", None), {}), codes, credit_masks),
+        "by_year": {},
+        "by_course_type": {}
+    }
+
+    for (group, key), masks in bitsets.items():
+        if group == "year":
+            analytics_data["by_year"][key] = compare_masks(pathways, masks, codes, credit_masks)
+        elif group == "course_type":
+            analytics_data["by_course_type"][key] = compare_masks(pathways, masks, codes, credit_masks)
+
+    return analytics_data
+
+def main():
+    """Write pathway-analytics.json for the pathway JSON in a catalogue directory"""
+    catalogue_dir = sys.argv[1] if len(sys.argv) > 1 else "pathways"
+
+    catalogue = course_catalogue.load_catalogue(catalogue_dir)
+    analytics_data = create_overlap_analytics(catalogue)
+
+    output_path = f"{catalogue_dir}/pathway-analytics.json"
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(analytics_data, f, indent=2, ensure_ascii=False)
+
+    print(f"Saved {output_path}")
+
+if __name__ == "__main__":
+    main()
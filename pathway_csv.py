@@ -0,0 +1,179 @@
+import csv
+import re
+
+from course_scanner import scan_course_text
+
+# CSV frontend shared by the converter, the validator and the sheet fetcher:
+# parses one pathway spreadsheet export into the nested pathway dict.
+
+# Manual spreadsheet exports for each pathway, relative to pathways/
+CSV_FILES = {
+    "creative-technologist": "baseFiles/DF UG_StudentPathways.csv",
+    "physical-interface-designer": "baseFiles/DF UG_StudentPathways2.csv",
+    "games-playable-media-maker": "baseFiles/DF UG_StudentPathways3.csv"
+}
+
+def parse_course_info(course_text):
+    """Parse course information from the CSV text format"""
+    return scan_course_text(course_text)
+
+def parse_csv_to_json(csv_file_path, pathway_name, unparsed=None):
+    """Parse CSV file and convert to structured JSON"""
+    with open(csv_file_path, 'r', encoding='latin-1') as file:
+        reader = csv.reader(file)
+        rows = list(reader)
+
+    return parse_csv_rows(rows, pathway_name, unparsed)
+
+def parse_csv_rows(rows, pathway_name, unparsed=None):
+    """Convert the rows of a pathway spreadsheet to structured JSON.
+
+    When an unparsed list is given, every non-empty course cell that
+    parse_course_info rejects is appended to it as
+    {"pathway", "row", "column", "text"}.
+    """
+    courses_data = {
+        "name": pathway_name.replace('-', ' ').title(),
+        "years": {}
+    }
+
+    def parse_cell(row_number, row, column):
+        course = parse_course_info(row[column])
+        if course is None and unparsed is not None:
+            unparsed.append({
+                "pathway": pathway_name,
+                "row": row_number,
+                "column": column,
+                "text": row[column].strip().split('\n')[0][:80]
+            })
+        return course
+
+    current_year = None
+    current_semester = None
+
+    for row_number, row in enumerate(rows, 1):
+        # Skip empty rows
+        if not any(cell.strip() for cell in row):
+            continue
+
+        # Look for year headers
+        year_match = re.match(r'YEAR (\d)', row[1])
+        if year_match:
+            current_year = year_match.group(1)
+            if current_year not in courses_data["years"]:
+                courses_data["years"][current_year] = {
+                    "fall": {
+                        "core_courses": [],
+                        "program_specific_electives": [],
+                        "open_electives": [],
+                        "breadth_electives": []
+                    },
+                    "winter": {
+                        "core_courses": [],
+                        "program_specific_electives": [],
+                        "open_electives": [],
+                        "breadth_electives": []
+                    }
+                }
+            
+            # Check if this same row also has semester info
+            semester_match = re.match(r'Semester (\d) \((\w+)\)', row[2])
+            if semester_match:
+                semester_name = semester_match.group(2).lower()
+                current_semester = semester_name
+            
+            # Process courses in this row if semester is set
+            if current_semester and len(row) >= 7:
+                semester_data = courses_data["years"][current_year][current_semester]
+                
+                # Core Courses (column 3)
+                if len(row) > 3 and row[3] and row[3].strip():
+                    course = parse_cell(row_number, row, 3)
+                    if course:
+                        semester_data["core_courses"].append(course)
+
+                # Program-Specific Electives (column 4)
+                if len(row) > 4 and row[4] and row[4].strip():
+                    course = parse_cell(row_number, row, 4)
+                    if course:
+                        semester_data["program_specific_electives"].append(course)
+
+                # Open Electives (column 5)
+                if len(row) > 5 and row[5] and row[5].strip():
+                    course = parse_cell(row_number, row, 5)
+                    if course:
+                        semester_data["open_electives"].append(course)
+
+                # Breadth Electives (column 6)
+                if len(row) > 6 and row[6] and row[6].strip():
+                    course = parse_cell(row_number, row, 6)
+                    if course:
+                        semester_data["breadth_electives"].append(course)
+            
+            continue
+
+        # Look for semester headers (in rows that don't have year headers)
+        semester_match = re.match(r'Semester (\d) \((\w+)\)', row[2])
+        if semester_match and current_year:
+            semester_name = semester_match.group(2).lower()
+            current_semester = semester_name
+            
+            # Process courses in this same row if they exist
+            if len(row) >= 7:
+                semester_data = courses_data["years"][current_year][current_semester]
+                
+                # Core Courses (column 3)
+                if len(row) > 3 and row[3] and row[3].strip():
+                    course = parse_cell(row_number, row, 3)
+                    if course:
+                        semester_data["core_courses"].append(course)
+
+                # Program-Specific Electives (column 4)
+                if len(row) > 4 and row[4] and row[4].strip():
+                    course = parse_cell(row_number, row, 4)
+                    if course:
+                        semester_data["program_specific_electives"].append(course)
+
+                # Open Electives (column 5)
+                if len(row) > 5 and row[5] and row[5].strip():
+                    course = parse_cell(row_number, row, 5)
+                    if course:
+                        semester_data["open_electives"].append(course)
+
+                # Breadth Electives (column 6)
+                if len(row) > 6 and row[6] and row[6].strip():
+                    course = parse_cell(row_number, row, 6)
+                    if course:
+                        semester_data["breadth_electives"].append(course)
+            
+            continue
+
+        # Process course data if we have a current semester
+        if current_year and current_semester and len(row) >= 7:
+            semester_data = courses_data["years"][current_year][current_semester]
+            
+            # Core Courses (column 3)
+            if len(row) > 3 and row[3] and row[3].strip():
+                course = parse_cell(row_number, row, 3)
+                if course:
+                    semester_data["core_courses"].append(course)
+
+            # Program-Specific Electives (column 4)
+            if len(row) > 4 and row[4] and row[4].strip():
+                course = parse_cell(row_number, row, 4)
+                if course:
+                    semester_data["program_specific_electives"].append(course)
+
+            # Open Electives (column 5)
+            if len(row) > 5 and row[5] and row[5].strip():
+                course = parse_cell(row_number, row, 5)
+                if course:
+                    semester_data["open_electives"].append(course)
+
+            # Breadth Electives (column 6)
+            if len(row) > 6 and row[6] and row[6].strip():
+                course = parse_cell(row_number, row, 6)
+                if course:
+                    semester_data["breadth_electives"].append(course)
+
+    return courses_data
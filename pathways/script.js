@@ -1,11 +1,17 @@
 // New layout JavaScript - Sidebar + Grid functionality
 
+// Must match BUNDLE_SCHEMA_VERSION in course_catalogue.py
+const BUNDLE_SCHEMA_VERSION = 3;
+
 class PathwayViewer {
     constructor() {
         this.currentPathway = null;
-        this.pathwayData = {};
         this.comparisonData = {};
         this.searchIndex = {};
+        this.courses = [];
+        this.placements = [];
+        this.views = {};
+        this.autocomplete = null;
 
         this.init();
     }
@@ -18,20 +24,21 @@ class PathwayViewer {
 
     async loadData() {
         try {
-            // Load pathway data
-            const pathways = ['creative-technologist', 'physical-interface-designer', 'games-playable-media-maker'];
+            // Everything comes from one bundle: a shared course table plus
+            // pathways, comparison and search index that refer into it
+            const response = await fetch('pathways-bundle.json');
+            const bundle = await response.json();
 
-            for (const pathway of pathways) {
-                const response = await fetch(`${pathway}.json`);
-                this.pathwayData[pathway] = await response.json();
+            if (bundle.schema_version !== BUNDLE_SCHEMA_VERSION) {
+                throw new Error(`Unsupported bundle schema version ${bundle.schema_version}`);
             }
 
-            // Load comparison and search data
-            const comparisonResponse = await fetch('pathway-comparison.json');
-            this.comparisonData = await comparisonResponse.json();
-
-            const searchResponse = await fetch('searchable-index.json');
-            this.searchIndex = await searchResponse.json();
+            this.courses = bundle.courses;
+            this.placements = bundle.placements;
+            this.comparisonData = bundle.comparison;
+            this.searchIndex = bundle.index;
+            this.views = bundle.views;
+            this.autocomplete = bundle.autocomplete;
 
         } catch (error) {
             console.error('Error loading data:', error);
@@ -59,6 +66,11 @@ class PathwayViewer {
             }
         });
 
+        // Course search
+        document.getElementById('courseSearch').addEventListener('input', (e) => {
+            this.showSearchResults(e.target.value);
+        });
+
         // Keyboard navigation
         document.addEventListener('keydown', (e) => {
             if (e.key === 'Escape') {
@@ -77,7 +89,7 @@ class PathwayViewer {
         document.querySelector(`[data-pathway="${pathway}"]`).classList.add('active');
 
         // Update header info
-        const pathwayName = this.pathwayData[pathway].name;
+        const pathwayName = this.views[pathway].name;
         document.querySelector('.pathway-info').textContent = `Viewing ${pathwayName} pathway`;
 
         // Populate course grid
@@ -86,7 +98,7 @@ class PathwayViewer {
 
     populateCourseGrid(pathway) {
         const container = document.getElementById('courseGridContainer');
-        const data = this.pathwayData[pathway];
+        const view = this.views[pathway];
 
         // Clear existing content
         container.innerHTML = '';
@@ -101,71 +113,44 @@ class PathwayViewer {
         grid.appendChild(cornerCell);
 
         // Course type headers
-        const courseTypes = [
-            { key: 'core_courses', label: 'Core Courses' },
-            { key: 'program_specific_electives', label: 'Program Specific Electives' },
-            { key: 'open_electives', label: 'Open Electives' },
-            { key: 'breadth_electives', label: 'Breadth Electives' }
-        ];
-
-        courseTypes.forEach(type => {
+        view.columns.forEach(column => {
             const header = document.createElement('div');
             header.className = 'grid-header course-type-label';
-            header.textContent = type.label;
+            header.textContent = column.label;
             grid.appendChild(header);
         });
 
-        // Year rows with data (Fall and Winter semesters)
-        for (let year = 1; year <= 4; year++) {
-            const yearData = data.years[year.toString()];
-            if (!yearData) continue;
-
-            // Fall semester
-            if (yearData.fall) {
-                // Year/Semester label
-                const fallLabel = document.createElement('div');
-                fallLabel.className = 'grid-header year-label';
-                fallLabel.textContent = `Year ${year} - Fall`;
-                grid.appendChild(fallLabel);
-
-                // Course cells for each type in Fall
-                courseTypes.forEach(type => {
-                    const courses = yearData.fall[type.key] || [];
-                    const cell = this.createGridCell(courses);
-                    grid.appendChild(cell);
-                });
-            }
+        // Rows arrive already grouped and sorted by the converter
+        view.rows.forEach(row => {
+            const label = document.createElement('div');
+            label.className = 'grid-header year-label';
+            label.textContent = row.label;
+            grid.appendChild(label);
 
-            // Winter semester
-            if (yearData.winter) {
-                // Year/Semester label
-                const winterLabel = document.createElement('div');
-                winterLabel.className = 'grid-header year-label';
-                winterLabel.textContent = `Year ${year} - Winter`;
-                grid.appendChild(winterLabel);
-
-                // Course cells for each type in Winter
-                courseTypes.forEach(type => {
-                    const courses = yearData.winter[type.key] || [];
-                    const cell = this.createGridCell(courses);
-                    grid.appendChild(cell);
-                });
-            }
-        }
+            row.cells.forEach(cellData => {
+                grid.appendChild(this.createGridCell(cellData));
+            });
+        });
 
         container.appendChild(grid);
     }
 
-    createGridCell(courses) {
+    createGridCell(cellData) {
         const cell = document.createElement('div');
         cell.className = 'grid-cell';
 
-        if (courses.length === 0) {
+        if (cellData.course_count === 0) {
             cell.classList.add('empty');
             return cell;
         }
 
-        courses.forEach(course => {
+        const badge = document.createElement('div');
+        badge.className = 'cell-badge';
+        badge.textContent = `${cellData.course_count} ${cellData.course_count === 1 ? 'course' : 'courses'} · ${cellData.total_credits} Credits`;
+        cell.appendChild(badge);
+
+        cellData.course_ids.forEach(courseId => {
+            const course = this.courses[courseId];
             const courseItem = document.createElement('div');
             // Add class based on credit value
             const creditClass = course.credits === 1.0 ? 'course-item-full' : 'course-item-half';
@@ -202,6 +187,69 @@ class PathwayViewer {
         document.body.style.overflow = 'hidden';
     }
 
+    completeCourses(query, limit = 10) {
+        // Mirrors complete() in autocomplete.py: every query word must prefix
+        // a code or title word; smaller positions are offered by more pathways
+        const normalize = text => text.normalize('NFKD').replace(/\p{M}/gu, '').toLowerCase().replace(/[^\p{L}\p{N}]+/gu, '');
+        const prefixes = query.split(/\s+/).map(normalize).filter(Boolean);
+        if (!this.autocomplete || prefixes.length === 0) {
+            return [];
+        }
+
+        const { courses, terms, postings, top } = this.autocomplete;
+        const lowerBound = (value) => {
+            let low = 0;
+            let high = terms.length;
+            while (low < high) {
+                const middle = (low + high) >> 1;
+                if (terms[middle] < value) {
+                    low = middle + 1;
+                } else {
+                    high = middle;
+                }
+            }
+            return low;
+        };
+
+        let matches = null;
+        for (const prefix of prefixes) {
+            if (prefixes.length === 1 && top[prefix] && limit <= top[prefix].length) {
+                return top[prefix].slice(0, limit).map(position => this.courses[courses[position]]);
+            }
+
+            const positions = new Set();
+            for (let index = lowerBound(prefix); index < terms.length && terms[index].startsWith(prefix); index++) {
+                postings[index].forEach(position => positions.add(position));
+            }
+            matches = matches === null ? positions : new Set([...matches].filter(position => positions.has(position)));
+        }
+
+        return [...matches]
+            .sort((a, b) => a - b)
+            .slice(0, limit)
+            .map(position => this.courses[courses[position]]);
+    }
+
+    showSearchResults(query) {
+        const results = document.getElementById('searchResults');
+        results.innerHTML = '';
+
+        this.completeCourses(query).forEach(course => {
+            const item = document.createElement('li');
+            const code = document.createElement('span');
+            code.className = 'course-code';
+            code.textContent = course.code;
+            item.appendChild(code);
+            item.appendChild(document.createTextNode(course.title));
+
+            item.addEventListener('click', () => {
+                this.showCourseModal(course);
+            });
+
+            results.appendChild(item);
+        });
+    }
+
     closeModal() {
         const modal = document.getElementById('courseModal');
         modal.style.display = 'none';
@@ -0,0 +1,229 @@
+import json
+import random
+import sys
+import time
+
+import numpy as np
+
+import course_catalogue
+
+# Terms in more than this share of documents carry almost no signal, and
+# their posting lists dominate the cost of the similarity products
+MAX_DOCUMENT_FREQUENCY = 0.5
+
+# Upper bound on score cells (chunk rows x courses) held at once
+CHUNK_CELLS = 1 << 21
+
+# Upper bound on expanded products (chunk nonzeros x their posting lengths)
+# held at once; these arrays grow with the postings, not the course count
+CHUNK_ENTRIES = 1 << 21
+
+def collect_documents(catalogue):
+    """Return (codes, titles, token lists), one document per distinct course code"""
+    title_words, desc_words = course_catalogue.get_course_words(catalogue)
+
+    codes = []
+    titles = []
+    documents = []
+    seen = set()
+
+    for course_id, course in enumerate(catalogue["courses"]):
+        # Variants of the same code share one entry, as in the static pages
+        if not course["code"] or course["code"] in seen:
+            continue
+        seen.add(course["code"])
+
+        codes.append(course["code"])
+        titles.append(course["title"])
+        documents.append(title_words[course_id] + desc_words[course_id])
+
+    return codes, titles, documents
+
+def build_tfidf_matrix(documents, max_document_frequency=MAX_DOCUMENT_FREQUENCY):
+    """Vectorize documents into an L2-normalized sparse TF-IDF matrix.
+
+    Returns (indptr, indices, data, term count) in CSR layout. Terms that
+    occur in a single document cannot make two courses similar, so they are
+    dropped along with terms above max_document_frequency.
+    """
+    document_frequency = {}
+    for tokens in documents:
+        for token in set(tokens):
+            document_frequency[token] = document_frequency.get(token, 0) + 1
+
+    max_count = max(2, int(max_document_frequency * len(documents)))
+    term_ids = {}
+    for token, count in sorted(document_frequency.items()):
+        if 2 <= count <= max_count:
+            term_ids[token] = len(term_ids)
+
+    indptr = [0]
+    indices = []
+    counts = []
+    for tokens in documents:
+        row = {}
+        for token in tokens:
+            term_id = term_ids.get(token)
+            if term_id is not None:
+                row[term_id] = row.get(term_id, 0) + 1
+        indices.extend(row.keys())
+        counts.extend(row.values())
+        indptr.append(len(indices))
+
+    indptr = np.array(indptr, dtype=np.int64)
+    indices = np.array(indices, dtype=np.int64)
+    counts = np.array(counts, dtype=np.float64)
+
+    # Sublinear tf times smoothed idf, then normalize every row
+    term_frequency = np.bincount(indices, minlength=len(term_ids))
+    idf = np.log((1 + len(documents)) / (1 + term_frequency)) + 1
+    data = (1 + np.log(counts)) * idf[indices] if len(indices) else counts
+
+    row_ids = np.repeat(np.arange(len(documents)), np.diff(indptr))
+    norms = np.sqrt(np.bincount(row_ids, weights=data * data, minlength=len(documents)))
+    data = data / norms[row_ids] if len(data) else data
+
+    return indptr, indices, data, len(term_ids)
+
+def transpose_matrix(indptr, indices, data, term_count):
+    """Convert a CSR matrix to CSC, giving every term its posting list of rows"""
+    row_ids = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    order = np.argsort(indices, kind='stable')
+    column_ptr = np.zeros(term_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(indices, minlength=term_count), out=column_ptr[1:])
+    return column_ptr, row_ids[order], data[order]
+
+def chunk_similarities(matrix, postings, start, end):
+    """Return the dense (end - start) x courses block of the product A[start:end] @ A.T"""
+    indptr, indices, data = matrix
+    column_ptr, posting_rows, posting_data = postings
+    course_count = len(indptr) - 1
+
+    # Every nonzero (row, term, weight) in the chunk meets every row in the term's postings
+    entry_start, entry_end = indptr[start], indptr[end]
+    terms = indices[entry_start:entry_end]
+    weights = data[entry_start:entry_end]
+    local_rows = np.repeat(np.arange(end - start), np.diff(indptr[start:end + 1]))
+
+    lengths = column_ptr[terms + 1] - column_ptr[terms]
+    offsets = np.cumsum(lengths) - lengths
+    positions = np.repeat(column_ptr[terms] - offsets, lengths) + np.arange(lengths.sum())
+
+    cells = np.repeat(local_rows * course_count, lengths) + posting_rows[positions]
+    products = np.repeat(weights, lengths) * posting_data[positions]
+
+    scores = np.bincount(cells, weights=products, minlength=(end - start) * course_count)
+    return scores.reshape(end - start, course_count)
+
+def chunk_bounds(matrix, postings, chunk_cells=CHUNK_CELLS, chunk_entries=CHUNK_ENTRIES):
+    """Yield (start, end) row ranges holding at most chunk_cells scores and chunk_entries expanded products.
+
+    A row expands into the summed posting lengths of its terms, so the
+    cumulative sum over rows gives every range's expansion size directly.
+    A single row over the limit still gets a chunk of its own.
+    """
+    indptr, indices, data = matrix
+    column_ptr = postings[0]
+    course_count = len(indptr) - 1
+    max_rows = max(1, chunk_cells // max(1, course_count))
+
+    entry_expansion = np.diff(column_ptr)[indices]
+    expansion_ptr = np.zeros(len(indices) + 1, dtype=np.int64)
+    np.cumsum(entry_expansion, out=expansion_ptr[1:])
+    row_expansion_ptr = expansion_ptr[indptr]
+
+    start = 0
+    while start < course_count:
+        end = int(np.searchsorted(row_expansion_ptr, row_expansion_ptr[start] + chunk_entries, side='right')) - 1
+        end = min(max(end, start + 1), start + max_rows, course_count)
+        yield start, end
+        start = end
+
+def top_k_similar(matrix, postings, k=5, min_score=0.05, chunk_cells=CHUNK_CELLS, chunk_entries=CHUNK_ENTRIES):
+    """Yield (row, [(score, other row)]) for every row, best matches first.
+
+    Rows are processed in chunks sized so that at most chunk_cells scores
+    and chunk_entries expanded products are alive at a time, which bounds
+    memory independently of the course count and the posting lengths.
+    """
+    course_count = len(matrix[0]) - 1
+    k = min(k, course_count - 1)
+
+    for start, end in chunk_bounds(matrix, postings, chunk_cells, chunk_entries):
+        scores = chunk_similarities(matrix, postings, start, end)
+        scores[np.arange(end - start), np.arange(start, end)] = -1.0
+
+        if k <= 0:
+            best = np.empty((end - start, 0), dtype=np.int64)
+        else:
+            best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        best_scores = np.take_along_axis(scores, best, axis=1)
+        order = np.argsort(-best_scores, axis=1, kind='stable')
+        best = np.take_along_axis(best, order, axis=1)
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+
+        for offset in range(end - start):
+            yield start + offset, [
+                (float(score), int(other_index))
+                for score, other_index in zip(best_scores[offset], best[offset])
+                if score >= min_score
+            ]
+
+def create_related_courses_json(catalogue, k=5):
+    """Create the precomputed related-courses table keyed by course code"""
+    codes, titles, documents = collect_documents(catalogue)
+    indptr, indices, data, term_count = build_tfidf_matrix(documents)
+    postings = transpose_matrix(indptr, indices, data, term_count)
+
+    related = {}
+    for row_index, best in top_k_similar((indptr, indices, data), postings, k):
+        related[codes[row_index]] = [
+            {
+                "code": codes[other_index],
+                "title": titles[other_index],
+                "score": round(score, 4)
+            }
+            for score, other_index in best
+        ]
+
+    return {
+        "program": catalogue["program"],
+        "academic_year": catalogue["academic_year"],
+        "related_courses": related
+    }
+
+def benchmark(course_count=50000, vocabulary_size=20000, words_per_course=60, k=5, seed=0):
+    """Time the related-course build on a synthetic catalogue of course_count courses"""
+    rng = random.Random(seed)
+    vocabulary = [f"term{index}" for index in range(vocabulary_size)]
+    # Zipf-like word frequencies, as in real descriptions
+    weights = [1 / (rank + 1) for rank in range(vocabulary_size)]
+    documents = [rng.choices(vocabulary, weights, k=words_per_course) for _ in range(course_count)]
+
+    start = time.perf_counter()
+    indptr, indices, data, term_count = build_tfidf_matrix(documents)
+    postings = transpose_matrix(indptr, indices, data, term_count)
+    rows = sum(1 for _ in top_k_similar((indptr, indices, data), postings, k))
+    return rows, time.perf_counter() - start
+
+def main():
+    """Write related-courses.json for a catalogue directory, or benchmark with --benchmark N"""
+    if len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+        course_count = int(sys.argv[2]) if len(sys.argv) > 2 else 50000
+        rows, seconds = benchmark(course_count)
+        print(f"Computed related courses for {rows} courses in {seconds:.1f}s")
+        return
+
+    catalogue_dir = sys.argv[1] if len(sys.argv) > 1 else "pathways"
+
+    catalogue = course_catalogue.load_catalogue(catalogue_dir)
+    related_data = create_related_courses_json(catalogue)
+
+    output_path = f"{catalogue_dir}/related-courses.json"
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(related_data, f, indent=2, ensure_ascii=False)
+
+    print(f"Saved {output_path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import csv
+import io
+import random
+from pathlib import Path
+
+import pytest
+
+from convert_csv_to_json_simple import decode_csv_bytes, tokenize_csv
+
+BASE_FILES = sorted((Path(__file__).resolve().parent.parent / "pathways" / "baseFiles").glob("*.csv"))
+
+EDGE_CASES = [
+    "",
+    "a,b,c",
+    "a,b\r\nc,d\r\n",
+    "a\rb",
+    '"x, y",z\n',
+    '"he said ""hi""",2',
+    '"multi\nline\r\ncell",x\r\nnext,row',
+    'a,,\n,,b',
+    "a,",
+    '""',
+    'a,""\n',
+    "\n",
+    "a\n\nb",
+    "a\r\n\r\n",
+    '"q"tail,x',
+    'x"y,z',
+    '"unterminated\nrest',
+    "é,ü\n",
+]
+
+def reference_rows(content):
+    return list(csv.reader(io.StringIO(content, newline='')))
+
+@pytest.mark.parametrize("path", BASE_FILES, ids=lambda path: path.name)
+def test_tokenizer_matches_csv_reader_on_base_files(path):
+    content = decode_csv_bytes(path.read_bytes())
+    assert list(tokenize_csv(content)) == reference_rows(content)
+
+@pytest.mark.parametrize("content", EDGE_CASES)
+def test_tokenizer_matches_csv_reader_on_edge_cases(content):
+    assert list(tokenize_csv(content)) == reference_rows(content)
+
+def test_tokenizer_matches_csv_reader_on_fuzzed_content():
+    rng = random.Random(0)
+    fragments = ['a', 'b c', ',', '"', '""', '\n', '\r\n', '\r', 'é', 'x"y', ' ']
+
+    mismatches = []
+    for _ in range(20000):
+        content = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 12)))
+        if list(tokenize_csv(content)) != reference_rows(content):
+            mismatches.append(content)
+
+    assert mismatches == []
+
+def test_decodes_utf8_and_strips_bom():
+    assert decode_csv_bytes("DF – Café".encode('utf-8')) == "DF – Café"
+    assert decode_csv_bytes(b'\xef\xbb\xbfYEAR 1') == "YEAR 1"
+
+def test_falls_back_to_cp1252():
+    assert decode_csv_bytes("DF – “Café” •".encode('cp1252')) == "DF – “Café” •"
+
+def test_bytes_undefined_in_cp1252_fall_back_to_latin1():
+    assert decode_csv_bytes(b'a\x81b\x9dc\x96') == "a\x81b\x9dc–"
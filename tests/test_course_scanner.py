@@ -0,0 +1,114 @@
+import random
+import re
+import time
+
+import pytest
+
+from course_scanner import scan_course_text
+
+# The default variant is used by the v1 converter; the v2 and simple
+# converters require the hyphen and the "Credits" word
+VARIANTS = {
+    "default": {},
+    "strict": {"hyphen_optional": False, "credits_word_optional": False},
+}
+
+FUZZ_FRAGMENTS = [
+    "DIGF-1002", "DIGF1003", "GDES-S2001", " ", "  ", "\n", "\t", "Atelier", "Game Engines",
+    "(0.5 Credits)", "(1.0 Credit)", "(0.5)", "(1.0  Credits )", "(", ")", "(note)", "0.5",
+    "Requisites:", "Requisite:", "Requisites: DIGF-1001", "Co-Requisite: none", ".", "-",
+    "See (DIGF-2002)", "Credits", "x"
+]
+
+def regex_course_text(course_text, hyphen_optional=True, credits_word_optional=True):
+    """The original regex implementation, kept as the reference for fuzzing"""
+    if not course_text or course_text.strip() == "":
+        return None
+
+    code = r'[A-Z]{4}-?\d{4}' if hyphen_optional else r'[A-Z]{4}-\d{4}'
+    credits = r'(?:Credits?)?' if credits_word_optional else r'Credits?'
+
+    course_match = re.match(rf'^({code})\s+(.+?)\s*\(([\d.]+)\s*{credits}\)', course_text.strip())
+    if course_match:
+        description_text = re.sub(rf'^{code}\s+.+\s*\([\d.]+\s*{credits}\)\s*', '', course_text.strip())
+        prereq_match = re.search(r'Requisites?:\s*(.+?)(?:\n|$)', description_text, re.DOTALL)
+
+        return {
+            "code": course_match.group(1),
+            "title": course_match.group(2).strip(),
+            "credits": float(course_match.group(3)),
+            "description": re.sub(r'Requisites?:\s*.+$', '', description_text, flags=re.MULTILINE).strip(),
+            "prerequisites": prereq_match.group(1).strip() if prereq_match else None
+        }
+
+    return None
+
+def fuzz_cells(iterations=20000, seed=0):
+    """Yield random cells, half of them well-formed course headers"""
+    rng = random.Random(seed)
+    separators = ['', ' ', '\n']
+
+    for _ in range(iterations):
+        if rng.random() < 0.5:
+            # Well-formed: code, title, one credit group, description, optional requisites
+            yield (f"{rng.choice(['DIGF-', 'INTM', 'VISM-'])}{rng.randint(1000, 4999)}"
+                   f"{rng.choice([' ', '  ', ' '])}{rng.choice(['Atelier I: Discovery', 'Critical Play', 'Body, Object & Space'])}"
+                   f"{rng.choice([' ', '', '  '])}({rng.choice(['0.5', '1.0', '1'])}{rng.choice([' Credits', ' Credit', '', 'Credits'])})"
+                   f"{rng.choice(separators)}{''.join(rng.choice(FUZZ_FRAGMENTS) for _ in range(rng.randint(0, 8)))}")
+        else:
+            yield "".join(rng.choice(FUZZ_FRAGMENTS) for _ in range(rng.randint(0, 10)))
+
+def adversarial_cells(size):
+    """Cells on which the regex backtracks quadratically"""
+    return {
+        "long whitespace run": "DIGF-1002 A" + " " * size + "x",
+        "many parentheses": "DIGF-1002 Title " + "(note) " * (size // 7) + "(0.5 Credits)",
+        "unclosed credit groups": "DIGF-1002 Title " + "(0.5 " * (size // 5),
+        "pasted syllabus": "DIGF-1002 Title (0.5 Credits) " + "Week 1 (intro) reading (ch. 2) " * (size // 31)
+    }
+
+@pytest.mark.parametrize("variant", VARIANTS.values(), ids=VARIANTS.keys())
+def test_scanner_matches_regex_on_fuzzed_cells(variant):
+    mismatches = []
+    for text in fuzz_cells():
+        try:
+            expected = regex_course_text(text, **variant)
+        except ValueError:
+            # float() rejects numbers like '0.5.1'; both implementations raise
+            with pytest.raises(ValueError):
+                scan_course_text(text, **variant)
+            continue
+
+        if scan_course_text(text, **variant) != expected:
+            mismatches.append(text)
+
+    assert mismatches == []
+
+@pytest.mark.parametrize("variant", VARIANTS.values(), ids=VARIANTS.keys())
+def test_scanner_matches_regex_on_adversarial_cells(variant):
+    for text in adversarial_cells(2000).values():
+        assert scan_course_text(text, **variant) == regex_course_text(text, **variant)
+
+def test_strict_variant_requires_hyphen_and_credits_word():
+    strict = VARIANTS["strict"]
+    assert scan_course_text("DIGF1003 Atelier (0.5 Credits)", **strict) is None
+    assert scan_course_text("DIGF-1003 Atelier (0.5)", **strict) is None
+    assert scan_course_text("DIGF1003 Atelier (0.5)")["code"] == "DIGF1003"
+
+def test_parses_course_cell():
+    course = scan_course_text("DIGF-2002 Physical Computing (0.5 Credits)\nSensors and actuators.\nRequisites: DIGF-1002")
+    assert course == {
+        "code": "DIGF-2002",
+        "title": "Physical Computing",
+        "credits": 0.5,
+        "description": "Sensors and actuators.",
+        "prerequisites": "DIGF-1002"
+    }
+
+@pytest.mark.parametrize("variant", VARIANTS.values(), ids=VARIANTS.keys())
+def test_adversarial_cells_scan_in_linear_time(variant):
+    # The regex takes over a second on the 20k-space cell; the scanner a fraction of a millisecond
+    for name, text in adversarial_cells(20000).items():
+        start = time.perf_counter()
+        scan_course_text(text, **variant)
+        assert time.perf_counter() - start < 0.1, name
@@ -0,0 +1,21 @@
+import course_catalogue
+from credit_transfer import build_credit_table, calculate_transfer_credits
+
+def course(code, credits):
+    return {"code": code, "title": code, "credits": credits, "description": "", "prerequisites": None}
+
+def test_raw_catalogue_codes_match_normalized_registrar_codes():
+    # A catalogue that was never deduped still carries codes without hyphens
+    catalogue = course_catalogue.build_catalogue({
+        "creative-technologist": {"years": {
+            "1": {"fall": {"core_courses": [course("DIGF-1002", 0.5)]}},
+            "2": {"fall": {"core_courses": [course("DIGF2015", 1.0)]}}
+        }}
+    }, "v1")
+    course_index, columns, table = build_credit_table(catalogue)
+
+    assert set(course_index) == {"DIGF-1002", "DIGF-2015"}
+
+    completions = [(0, "DIGF-2015"), (0, "DIGF-1002"), (0, "DIGF-1002")]
+    credits = calculate_transfer_credits(1, completions, course_index, table)
+    assert credits.sum() == 1.5
@@ -0,0 +1,53 @@
+import time
+
+import course_catalogue
+from dedupe_courses import dedupe_catalogue
+
+DESCRIPTION = "Students explore physical computing with sensors, actuators and microcontrollers in studio projects"
+
+def course(code, title, description=DESCRIPTION):
+    return {"code": code, "title": title, "credits": 0.5, "description": description, "prerequisites": None}
+
+def catalogue_of(*pathway_courses):
+    """Build a v1 catalogue with one pathway per list of courses, all in year 1 fall core"""
+    return course_catalogue.build_catalogue({
+        f"pathway-{index}": {"years": {"1": {"fall": {"core_courses": courses}}}}
+        for index, courses in enumerate(pathway_courses)
+    }, "v1")
+
+def test_merges_near_duplicates_sharing_a_normalized_code():
+    catalogue = catalogue_of(
+        [course("DIGF2002", "Physical Computing")],
+        [course("DIGF-2002", "Physical Computing", DESCRIPTION + " too")],
+        [course("DIGF-2002", "Physical Computing")]
+    )
+    report = dedupe_catalogue(catalogue)
+
+    assert report["merged"] == [{"code": "DIGF-2002", "title": "Physical Computing", "variants": ["Physical Computing"]}]
+    assert report["flagged"] == []
+    assert [entry["code"] for entry in catalogue["courses"]] == ["DIGF-2002"]
+    assert {placement[4] for placement in catalogue["placements"]} == {0}
+
+def test_flags_cross_listings_as_one_group():
+    catalogue = catalogue_of([
+        course("DIGF-2002", "Physical Computing"),
+        course("INTM-2002", "Physical Computing"),
+        course("VISM-2002", "Physical Computing", DESCRIPTION + " too")
+    ])
+    report = dedupe_catalogue(catalogue)
+
+    assert report["merged"] == []
+    assert [entry["codes"] for entry in report["flagged"]] == [["DIGF-2002", "INTM-2002", "VISM-2002"]]
+
+def test_shared_boilerplate_is_not_quadratic():
+    # Thousands of records with the same placeholder text land in every band
+    # bucket together; they must collapse instead of being compared pairwise
+    courses = [course(f"ELEC-{index:04d}", "Elective", "To be announced") for index in range(5000)]
+    catalogue = catalogue_of(courses)
+
+    start = time.perf_counter()
+    report = dedupe_catalogue(catalogue)
+    assert time.perf_counter() - start < 5
+
+    assert len(report["flagged"]) == 1
+    assert len(report["flagged"][0]["codes"]) == 5000
@@ -0,0 +1,82 @@
+import course_catalogue
+from diff_catalogues import diff_catalogues
+
+def course(code, title="Physical Computing", description="Sensors and actuators."):
+    return {"code": code, "title": title, "credits": 0.5, "description": description, "prerequisites": None}
+
+def v1_catalogue(pathways):
+    """Build a v1 catalogue from {pathway: {(year, semester, course_type): [course, ...]}}"""
+    pathways_data = {}
+    for pathway_name, cells in pathways.items():
+        years = {}
+        for (year, semester, course_type), courses in cells.items():
+            years.setdefault(year, {}).setdefault(semester, {})[course_type] = courses
+        pathways_data[pathway_name] = {"name": pathway_name, "years": years}
+    return course_catalogue.build_catalogue(pathways_data, "v1")
+
+def test_same_courses_in_v1_and_v2_layouts_have_no_changes():
+    old = v1_catalogue({"creative-technologist": {("1", "fall", "core_courses"): [course("DIGF-2002")]}})
+    new = course_catalogue.build_catalogue({"creative-technologist": {"name": "creative-technologist", "years": {
+        "Year 1": {"total_credits": 5.0, "semesters": {
+            "Semester 1 (Fall)": {"course_types": {"core": [course("DIGF-2002")], "open": []}}
+        }}
+    }}}, "v2")
+
+    diff = diff_catalogues(old, new)
+    assert all(count == 0 for count in diff["summary"].values())
+
+def test_normalized_codes_are_not_removed_and_added():
+    old = v1_catalogue({"creative-technologist": {("2", "fall", "core_courses"): [course("DIGF2015")]}})
+    new = v1_catalogue({"creative-technologist": {("2", "fall", "core_courses"): [course("DIGF-2015")]}})
+
+    diff = diff_catalogues(old, new)
+    assert all(count == 0 for count in diff["summary"].values())
+
+def test_text_changes_are_compared_in_every_pathway():
+    old = v1_catalogue({
+        "creative-technologist": {("1", "fall", "core_courses"): [course("DIGF-2002")]},
+        "physical-interface-designer": {("1", "fall", "core_courses"): [course("DIGF-2002")]}
+    })
+    new = v1_catalogue({
+        "creative-technologist": {("1", "fall", "core_courses"): [course("DIGF-2002")]},
+        "physical-interface-designer": {("1", "fall", "core_courses"): [course("DIGF-2002", description="Sensors.")]}
+    })
+
+    assert diff_catalogues(old, new)["courses"]["changed"] == [{
+        "pathway": "physical-interface-designer",
+        "code": "DIGF-2002",
+        "changes": {"description": {"old": "Sensors and actuators.", "new": "Sensors."}}
+    }]
+
+def test_extra_placement_is_added_not_moved():
+    fall = ("1", "fall", "core_courses")
+    winter = ("1", "winter", "open_electives")
+    old = v1_catalogue({"creative-technologist": {fall: [course("DIGF-2002")]}})
+    new = v1_catalogue({"creative-technologist": {fall: [course("DIGF-2002")], winter: [course("DIGF-2002")]}})
+
+    diff = diff_catalogues(old, new)
+    assert diff["placements"]["moved"] == []
+    assert diff["placements"]["added"] == [{
+        "pathway": "creative-technologist",
+        "code": "DIGF-2002",
+        "to": [{"year": "1", "semester": "winter", "course_type": "open_electives"}]
+    }]
+
+    diff = diff_catalogues(new, old)
+    assert diff["placements"]["moved"] == []
+    assert diff["placements"]["removed"] == [{
+        "pathway": "creative-technologist",
+        "code": "DIGF-2002",
+        "from": [{"year": "1", "semester": "winter", "course_type": "open_electives"}]
+    }]
+
+def test_changed_cell_is_moved():
+    old = v1_catalogue({"creative-technologist": {("1", "fall", "core_courses"): [course("DIGF-2002")]}})
+    new = v1_catalogue({"creative-technologist": {("2", "fall", "core_courses"): [course("DIGF-2002")]}})
+
+    assert diff_catalogues(old, new)["placements"]["moved"] == [{
+        "pathway": "creative-technologist",
+        "code": "DIGF-2002",
+        "from": [{"year": "1", "semester": "fall", "course_type": "core_courses"}],
+        "to": [{"year": "2", "semester": "fall", "course_type": "core_courses"}]
+    }]
@@ -0,0 +1,76 @@
+import asyncio
+import json
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+import fetch_sheets
+import pathway_csv
+
+PATHWAYS_DIR = Path(__file__).resolve().parent.parent / "pathways"
+
+@pytest.fixture
+def sheets(tmp_path):
+    """Copies of the baseFiles sheets, keyed by pathway name"""
+    paths = {}
+    for pathway_name, csv_path in pathway_csv.CSV_FILES.items():
+        paths[pathway_name] = tmp_path / f"{pathway_name}.csv"
+        shutil.copyfile(PATHWAYS_DIR / csv_path, paths[pathway_name])
+    return paths
+
+@pytest.fixture
+def server(sheets):
+    """A stand-in export endpoint on a free port"""
+    server = fetch_sheets.serve_sheets({f"{pathway_name}.csv": path for pathway_name, path in sheets.items()}, 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def fetch(server, cache_dir, query=""):
+    url_template = f"http://127.0.0.1:{server.server_address[1]}/{{pathway}}.csv{query}"
+    return asyncio.run(fetch_sheets.fetch_pathway_sheets(url_template, list(pathway_csv.CSV_FILES), cache_dir))
+
+def test_first_fetch_downloads_every_sheet(server, tmp_path):
+    pathways_data, report = fetch(server, tmp_path / "cache")
+
+    assert sorted(report["downloaded"]) == sorted(pathway_csv.CSV_FILES)
+    assert report["unchanged"] == []
+    assert list(pathways_data) == list(pathway_csv.CSV_FILES)
+    for pathway_name, csv_path in pathway_csv.CSV_FILES.items():
+        assert pathways_data[pathway_name] == pathway_csv.parse_csv_to_json(PATHWAYS_DIR / csv_path, pathway_name)
+
+def test_second_fetch_is_unchanged(server, tmp_path):
+    first_data, first_report = fetch(server, tmp_path / "cache")
+    pathways_data, report = fetch(server, tmp_path / "cache")
+
+    assert report["downloaded"] == []
+    assert sorted(report["unchanged"]) == sorted(pathway_csv.CSV_FILES)
+    assert pathways_data == first_data
+    # Cached sheets still report their unparsed cells
+    assert report["unparsed"]
+    assert sorted(report["unparsed"], key=json.dumps) == sorted(first_report["unparsed"], key=json.dumps)
+
+def test_editing_one_sheet_reparses_only_that_sheet(server, sheets, tmp_path):
+    fetch(server, tmp_path / "cache")
+
+    edited = next(iter(sheets))
+    text = sheets[edited].read_text(encoding='latin-1')
+    sheets[edited].write_text(text.replace("Atelier", "Studio"), encoding='latin-1')
+
+    pathways_data, report = fetch(server, tmp_path / "cache")
+
+    assert report["downloaded"] == [edited]
+    assert sorted(report["unchanged"]) == sorted(set(pathway_csv.CSV_FILES) - {edited})
+    assert "Studio" in json.dumps(pathways_data[edited])
+    assert "Atelier" not in json.dumps(pathways_data[edited])
+
+def test_changed_url_template_ignores_cached_validators(server, tmp_path):
+    fetch(server, tmp_path / "cache")
+    pathways_data, report = fetch(server, tmp_path / "cache", "?export=2")
+
+    assert sorted(report["downloaded"]) == sorted(pathway_csv.CSV_FILES)
+    assert report["unchanged"] == []
@@ -0,0 +1,65 @@
+import re
+import unicodedata
+from functools import lru_cache
+
+# Shared analyzer for course titles and descriptions. Every index builder
+# goes through analyze(), so the same word always produces the same key:
+#
+#   "Designing Interactive Systems, Café-style" -> ["design", "interactive", "system", "cafe", "style"]
+
+# Runs of letters and digits; punctuation and underscores separate tokens
+TOKEN_PATTERN = re.compile(r'[^\W_]+')
+
+STOPWORDS = frozenset("""
+    a about above after again against all also an and any are as at be because been before being
+    below between both but by can could did do does doing down during each either etc few for from
+    further had has have having he her here hers him his how however i if in into is it its itself
+    just may me more most must my no nor not now of off on once only or other our ours out over own
+    per same she should so some such than that the their theirs them then there these they this
+    those through thus to too under until up upon us very via was we were what when where which
+    while who whom why will with within without would you your yours
+    course courses student students
+""".split())
+
+MIN_TOKEN_LENGTH = 2
+
+def normalize_text(text):
+    """Casefold text and strip accents, so "Café" and "CAFE" compare equal"""
+    decomposed = unicodedata.normalize('NFKD', text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+def tokenize(text):
+    """Split text into normalized letter/digit tokens, without stopwords or stemming"""
+    return TOKEN_PATTERN.findall(normalize_text(text))
+
+def stem(word):
+    """Strip a plural ending, then an -ing/-ed ending that leaves at least four letters"""
+    if len(word) > 4 and word.endswith("ies"):
+        word = word[:-3] + "y"
+    elif len(word) > 4 and word.endswith(("sses", "xes", "ches", "shes")):
+        word = word[:-2]
+    elif len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        word = word[:-1]
+
+    for suffix in ("ing", "ed"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 4:
+            return word[:-len(suffix)]
+
+    return word
+
+@lru_cache(maxsize=65536)
+def analyze_token(token):
+    """Return the index term for a normalized token, or None for stopwords and short tokens"""
+    if len(token) < MIN_TOKEN_LENGTH or token in STOPWORDS or token.isdecimal():
+        return None
+    return stem(token)
+
+@lru_cache(maxsize=16384)
+def analyze(text):
+    """Return the index terms of a title or description, in order, as a tuple"""
+    terms = []
+    for token in tokenize(text):
+        term = analyze_token(token)
+        if term is not None:
+            terms.append(term)
+    return tuple(terms)
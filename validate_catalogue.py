@@ -0,0 +1,360 @@
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+import course_catalogue
+import pathway_csv
+
+COURSE_TYPES = ("core_courses", "program_specific_electives", "open_electives", "breadth_electives")
+SEMESTERS = ("fall", "winter")
+
+# Schema building blocks. A spec is one of:
+#   a type (str, list, ...)     -> isinstance check
+#   a dict                      -> object with exactly these keys
+#   a one-item list [spec]      -> list whose items all match spec
+#   Optional / MapOf / Pattern / Number -> see below
+
+class Optional:
+    """Value matching spec, or None"""
+    def __init__(self, spec):
+        self.spec = spec
+
+class MapOf:
+    """Object with arbitrary keys matching key_pattern, all values matching spec"""
+    def __init__(self, key_pattern, spec):
+        self.key_pattern = key_pattern
+        self.spec = spec
+
+class Pattern:
+    """String matching a regular expression"""
+    def __init__(self, pattern):
+        self.pattern = pattern
+
+class Number:
+    """int or float, but not bool"""
+
+COURSE_SPEC = {
+    "code": Pattern(r'^[A-Z]{4}-\d{4}$'),
+    "title": str,
+    "credits": Number,
+    "description": str,
+    "prerequisites": Optional(str)
+}
+
+SEMESTER_SPEC = {course_type: [COURSE_SPEC] for course_type in COURSE_TYPES}
+
+PATHWAY_SPEC = {
+    "name": str,
+    "years": MapOf(r'^[1-4]$', {semester: SEMESTER_SPEC for semester in SEMESTERS})
+}
+
+COMPARISON_SPEC = {
+    "program": str,
+    "academic_year": Pattern(r'^\d{4}/\d{2}$'),
+    "pathways": [str],
+    "comparison": {
+        "by_year": MapOf(r'^[1-4]$', {
+            semester: {course_type: MapOf(r'.', [str]) for course_type in COURSE_TYPES}
+            for semester in SEMESTERS
+        }),
+        "by_course_type": MapOf('^(' + '|'.join(COURSE_TYPES) + ')$', MapOf(r'.', {
+            "details": COURSE_SPEC,
+            "offered_in": [str]
+        })),
+        "all_courses": [str]
+    }
+}
+
+COURSE_INFO_SPEC = dict(COURSE_SPEC, **{
+    "pathway": str,
+    "year": Pattern(r'^[1-4]$'),
+    "semester": Pattern('^(' + '|'.join(SEMESTERS) + ')$'),
+    "course_type": Pattern('^(' + '|'.join(COURSE_TYPES) + ')$')
+})
+
+SEARCHABLE_INDEX_SPEC = {
+    "program": str,
+    "last_updated": Pattern(r'^\d{4}-\d{2}-\d{2}$'),
+    "search_index": {
+        "courses_by_code": MapOf(r'^[A-Z]{4}-\d{4}$', COURSE_INFO_SPEC),
+        "courses_by_title": MapOf(r'.', [COURSE_INFO_SPEC]),
+        "courses_by_keywords": MapOf(r'.', [COURSE_INFO_SPEC]),
+        "courses_by_pathway": MapOf(r'.', [COURSE_INFO_SPEC]),
+        "courses_by_year": MapOf(r'^[1-4]$', [COURSE_INFO_SPEC]),
+        "courses_by_course_type": MapOf('^(' + '|'.join(COURSE_TYPES) + ')$', [COURSE_INFO_SPEC])
+    }
+}
+
+BUNDLE_SPEC = {
+    "schema_version": int,
+    "program": str,
+    "academic_year": Pattern(r'^\d{4}/\d{2}$'),
+    "last_updated": Pattern(r'^\d{4}-\d{2}-\d{2}$'),
+    "courses": [COURSE_SPEC],
+    "placements": [list],
+    "pathways": MapOf(r'.', {
+        "name": str,
+        "years": MapOf(r'^[1-4]$', {
+            semester: {course_type: [int] for course_type in COURSE_TYPES}
+            for semester in SEMESTERS
+        })
+    }),
+    "views": MapOf(r'.', {
+        "pathway": str,
+        "name": str,
+        "columns": [{"key": str, "label": str}],
+        "rows": [{
+            "year": Pattern(r'^[1-4]$'),
+            "semester": Pattern('^(' + '|'.join(SEMESTERS) + ')$'),
+            "label": str,
+            "cells": [{
+                "course_type": Pattern('^(' + '|'.join(COURSE_TYPES) + ')$'),
+                "course_ids": [int],
+                "course_count": int,
+                "total_credits": Number
+            }]
+        }]
+    }),
+    "autocomplete": {
+        "courses": [int],
+        "terms": [str],
+        "postings": [[int]],
+        "top": MapOf(r'.', [int])
+    },
+    "comparison": {
+        "by_year": MapOf(r'^[1-4]$', {
+            semester: {course_type: MapOf(r'^\d+$', [str]) for course_type in COURSE_TYPES}
+            for semester in SEMESTERS
+        }),
+        "by_course_type": MapOf('^(' + '|'.join(COURSE_TYPES) + ')$', MapOf(r'^\d+$', [str]))
+    },
+    "index": {
+        "courses_by_code": MapOf(r'^[A-Z]{4}-\d{4}$', int),
+        "courses_by_title": MapOf(r'.', [int]),
+        "courses_by_keywords": MapOf(r'.', [int]),
+        "courses_by_pathway": MapOf(r'.', [int]),
+        "courses_by_year": MapOf(r'^[1-4]$', [int]),
+        "courses_by_course_type": MapOf('^(' + '|'.join(COURSE_TYPES) + ')$', [int])
+    }
+}
+
+OVERLAP_SPEC = {
+    "matrix": MapOf(r'.', MapOf(r'.', {
+        "shared_courses": int,
+        "shared_credits": Number,
+        "jaccard": Number
+    })),
+    "unique": MapOf(r'.', {
+        "courses": [str],
+        "credits": Number
+    })
+}
+
+ANALYTICS_SPEC = {
+    "program": str,
+    "academic_year": Pattern(r'^\d{4}/\d{2}$'),
+    "pathways": [str],
+    "overall": OVERLAP_SPEC,
+    "by_year": MapOf(r'^[1-4]$', OVERLAP_SPEC),
+    "by_course_type": MapOf('^(' + '|'.join(COURSE_TYPES) + ')$', OVERLAP_SPEC)
+}
+
+RELATED_COURSES_SPEC = {
+    "program": str,
+    "academic_year": Pattern(r'^\d{4}/\d{2}$'),
+    "related_courses": MapOf(r'^[A-Z]{4}-\d{4}$', [{
+        "code": Pattern(r'^[A-Z]{4}-\d{4}$'),
+        "title": str,
+        "score": Number
+    }])
+}
+
+def compile_schema(spec):
+    """Compile a schema spec into a checker function.
+
+    The checker returns None when the value is valid, otherwise a list of
+    (path, message) tuples. Paths are only built on failure, so checking
+    a valid document allocates nothing beyond the walk itself.
+    """
+    if isinstance(spec, Optional):
+        inner = compile_schema(spec.spec)
+
+        def check_optional(value):
+            if value is None:
+                return None
+            return inner(value)
+        return check_optional
+
+    if spec is Number:
+        def check_number(value):
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return [((), f"expected number, got {type(value).__name__}")]
+            return None
+        return check_number
+
+    if isinstance(spec, Pattern):
+        match = re.compile(spec.pattern).search
+
+        def check_pattern(value):
+            if not isinstance(value, str):
+                return [((), f"expected string, got {type(value).__name__}")]
+            if not match(value):
+                return [((), f"{value!r} does not match {spec.pattern}")]
+            return None
+        return check_pattern
+
+    if isinstance(spec, type):
+        def check_type(value):
+            if not isinstance(value, spec):
+                return [((), f"expected {spec.__name__}, got {type(value).__name__}")]
+            return None
+        return check_type
+
+    if isinstance(spec, list):
+        item_check = compile_schema(spec[0])
+
+        def check_list(value):
+            if not isinstance(value, list):
+                return [((), f"expected list, got {type(value).__name__}")]
+            errors = None
+            for index, item in enumerate(value):
+                item_errors = item_check(item)
+                if item_errors:
+                    errors = errors or []
+                    errors.extend(((index,) + path, message) for path, message in item_errors)
+            return errors
+        return check_list
+
+    if isinstance(spec, MapOf):
+        key_match = re.compile(spec.key_pattern).search
+        value_check = compile_schema(spec.spec)
+
+        def check_map(value):
+            if not isinstance(value, dict):
+                return [((), f"expected object, got {type(value).__name__}")]
+            errors = None
+            for key, item in value.items():
+                if not key_match(key):
+                    errors = errors or []
+                    errors.append(((key,), f"unexpected key {key!r}"))
+                    continue
+                item_errors = value_check(item)
+                if item_errors:
+                    errors = errors or []
+                    errors.extend(((key,) + path, message) for path, message in item_errors)
+            return errors
+        return check_map
+
+    if isinstance(spec, dict):
+        field_checks = [(key, compile_schema(field_spec)) for key, field_spec in spec.items()]
+        expected_keys = frozenset(spec)
+
+        def check_object(value):
+            if not isinstance(value, dict):
+                return [((), f"expected object, got {type(value).__name__}")]
+            errors = None
+            for key, field_check in field_checks:
+                if key not in value:
+                    errors = errors or []
+                    errors.append(((key,), "missing key"))
+                    continue
+                field_errors = field_check(value[key])
+                if field_errors:
+                    errors = errors or []
+                    errors.extend(((key,) + path, message) for path, message in field_errors)
+            if len(value) != len(expected_keys) or not expected_keys.issuperset(value):
+                errors = errors or []
+                for key in value:
+                    if key not in expected_keys:
+                        errors.append(((key,), "unexpected key"))
+            return errors
+        return check_object
+
+    raise TypeError(f"Unsupported schema spec: {spec!r}")
+
+# Compiled once at import time
+check_pathway = compile_schema(PATHWAY_SPEC)
+check_comparison = compile_schema(COMPARISON_SPEC)
+check_searchable_index = compile_schema(SEARCHABLE_INDEX_SPEC)
+check_bundle = compile_schema(BUNDLE_SPEC)
+check_analytics = compile_schema(ANALYTICS_SPEC)
+check_related_courses = compile_schema(RELATED_COURSES_SPEC)
+
+def format_errors(errors):
+    """Format checker errors as 'path: message' strings"""
+    return [
+        f"{'.'.join(str(part) for part in path) or '<root>'}: {message}"
+        for path, message in errors
+    ]
+
+def collect_unparsed_cells(catalogue_dir):
+    """Parse the baseFiles CSVs of a catalogue directory and return the cells the parser dropped"""
+    unparsed = []
+    for pathway_name, csv_path in pathway_csv.CSV_FILES.items():
+        full_path = os.path.join(catalogue_dir, csv_path)
+        if os.path.exists(full_path):
+            pathway_csv.parse_csv_to_json(full_path, pathway_name, unparsed)
+    return unparsed
+
+def validate_catalogue(catalogue_dir, unparsed_cells=()):
+    """Validate every generated file in a catalogue directory.
+
+    unparsed_cells is the list parse_csv_rows collected while parsing the
+    sources; each cell is reported under its pathway.
+    """
+    problems = {}
+    catalogue_path = Path(catalogue_dir)
+
+    checkers = {
+        "pathway-comparison.json": check_comparison,
+        "searchable-index.json": check_searchable_index,
+        "pathways-bundle.json": check_bundle,
+        "pathway-analytics.json": check_analytics,
+        "related-courses.json": check_related_courses
+    }
+
+    for json_path in sorted(catalogue_path.glob("*.json")):
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        checker = checkers.get(json_path.name)
+        if checker is None:
+            # Everything else with a years key is a pathway file
+            if not isinstance(data, dict) or "years" not in data:
+                continue
+            checker = check_pathway
+
+        errors = checker(data)
+        if checker is check_bundle and data.get("schema_version") != course_catalogue.BUNDLE_SCHEMA_VERSION:
+            errors = (errors or []) + [(("schema_version",), f"expected {course_catalogue.BUNDLE_SCHEMA_VERSION}")]
+        if errors:
+            problems[json_path.name] = format_errors(errors)
+
+    for cell in unparsed_cells:
+        problems.setdefault(f"{cell['pathway']} source", []).append(
+            f"row {cell['row']}, column {cell['column']}: unparsed course cell {cell['text']!r}"
+        )
+
+    return problems
+
+def main():
+    """Validate a catalogue directory and exit non-zero on any problem"""
+    catalogue_dir = sys.argv[1] if len(sys.argv) > 1 else "pathways"
+
+    problems = validate_catalogue(catalogue_dir, collect_unparsed_cells(catalogue_dir))
+
+    for file_name, messages in problems.items():
+        print(f"{file_name}:")
+        for message in messages:
+            print(f"  {message}")
+
+    if problems:
+        print(f"Validation failed: {sum(len(m) for m in problems.values())} problems")
+        sys.exit(1)
+
+    print("Validation passed")
+
+if __name__ == "__main__":
+    main()